@@ -0,0 +1,332 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Benchmarks for PyCSVSchema
+# Run all benchmarks with `python -m dev.benchmarks` from the root of the repository
+
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+# Modules which should not be imported by `import pycsvschema.checker`
+DEFERRED_MODULES = ('jsonschema', 'json', 'rfc3986', 'ipaddress', 'uuid', 'datetime', 'ast', 'tokenize')
+
+
+def bench_startup(repeat=10):
+    """
+    Measure the time of importing pycsvschema.checker in a fresh interpreter, and check heavy modules are deferred
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import pycsvschema.checker\n"
+        "print(time.perf_counter() - start)\n"
+        "print(','.join(m for m in {0!r} if m in sys.modules))\n".format(DEFERRED_MODULES)
+    )
+
+    timings = []
+    loaded = ''
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True).split('\n')
+        timings.append(float(out[0]))
+        loaded = out[1]
+
+    print("startup: import pycsvschema.checker best {0:.2f} ms of {1}".format(min(timings) * 1000, repeat))
+    if loaded:
+        print("startup: eagerly imported modules: {0}".format(loaded))
+    return min(timings)
+
+
+def bench_construct(number=1000):
+    """
+    Measure the time of constructing Validator with and without meta-schema validation
+    """
+    from pycsvschema.checker import Validator
+
+    def construct(check_schema):
+        schema = {'fields': [{'name': 'id', 'type': 'number'}], 'definitions': {}, 'patternFields': {}}
+        Validator(csvfile='', schema=schema, check_schema=check_schema)
+
+    for check_schema in (True, False):
+        t = timeit.timeit(lambda: construct(check_schema), number=number)
+        print("construct: check_schema={0} {1:.2f} us per call".format(check_schema, t / number * 1e6))
+
+
+def wide_schema(n_fields):
+    return {
+        'fields': [{'name': 'col_{0}'.format(i), 'type': 'number', 'enum': [1, 2, 3]} for i in range(n_fields)],
+        'definitions': {},
+        'patternFields': {}
+    }
+
+
+def bench_artifact(n_fields=3000, number=20):
+    """
+    Measure the time of constructing Validator from schema and from a saved schema artifact
+    """
+    from pycsvschema import artifact
+    from pycsvschema.checker import Validator
+
+    schema = wide_schema(n_fields)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'schema.artifact')
+        artifact.save_artifact(schema, path)
+
+        t = timeit.timeit(lambda: Validator(csvfile='', schema=wide_schema(n_fields)), number=number)
+        print("artifact: construct from schema with {0} fields {1:.2f} ms".format(n_fields, t / number * 1000))
+
+        t = timeit.timeit(lambda: Validator.from_artifact('', path), number=number)
+        print("artifact: construct from artifact with {0} fields {1:.2f} ms".format(n_fields, t / number * 1000))
+
+        t = timeit.timeit(lambda: Validator.from_artifact('', path, source_schema=schema), number=number)
+        print(
+            "artifact: construct from artifact with {0} fields and staleness check {1:.2f} ms".format(
+                n_fields, t / number * 1000
+            )
+        )
+
+
+def legacy_number_validator():
+    """
+    NumberValidator before numeric values were prevalidated
+    """
+    from pycsvschema.validators.types import TypeValidator
+
+    class LegacyNumberValidator(TypeValidator):
+        def __init__(self, field_schema):
+            super().__init__(field_schema=field_schema)
+            self.to_type = float
+            self.groupchar = self.field_schema.get('groupChar', '')
+
+        def validate(self, value):
+            if value is None:
+                return
+
+            value = value.replace(self.groupchar, '')
+            return self.try_convert_value(value=value, to_type=self.to_type, update=True)
+
+    return LegacyNumberValidator
+
+
+def bench_numeric(n_values=100000):
+    """
+    Measure the time of validating a column of numeric values with the legacy and current NumberValidator, every case
+    shares one validator for all values like Validator does
+    """
+    from pycsvschema.validators.types import NumberValidator
+
+    LegacyNumberValidator = legacy_number_validator()
+
+    for invalid_rate in (0, 0.1):
+        n_invalid = int(n_values * invalid_rate)
+        values = ['{0}.25'.format(i) for i in range(n_values - n_invalid)] + ['n/a'] * n_invalid
+        field_schema = {'type': 'number', 'groupChar': ''}
+        legacy = LegacyNumberValidator(field_schema)
+        validator = NumberValidator(field_schema)
+
+        cases = [
+            ('legacy', lambda: [legacy.validate(v) for v in values]),
+            ('convert', lambda: [validator.convert(v) for v in values]),
+        ]
+        for name, func in cases:
+            t = min(timeit.repeat(func, number=1, repeat=7))
+            print(
+                "numeric: {0} with {1:.0%} invalid values {2:.0f} ns per value".format(
+                    name, invalid_rate, t / n_values * 1e9
+                )
+            )
+
+
+def bench_projection(n_columns=2000, n_validated=10, n_rows=2000):
+    """
+    Measure the time of validating a wide CSV file with and without projection
+    """
+    from pycsvschema.checker import Validator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'wide.csv')
+        with open(path, 'w') as f:
+            f.write(','.join('col_{0}'.format(i) for i in range(n_columns)) + '\n')
+            row = ','.join(str(i) for i in range(n_columns)) + '\n'
+            for _ in range(n_rows):
+                f.write(row)
+
+        def schema():
+            return {
+                'fields': [{'name': 'col_{0}'.format(i * 7), 'type': 'number'} for i in range(n_validated)],
+                'definitions': {},
+                'patternFields': {}
+            }
+
+        for projection in (False, True):
+            t = min(
+                timeit.repeat(
+                    lambda: Validator(path, schema(), check_schema=False, projection=projection).validate(),
+                    number=1,
+                    repeat=3
+                )
+            )
+            print(
+                "projection: projection={0} {1} of {2} columns {3:.2f} us per row".format(
+                    projection, n_validated, n_columns, t / n_rows * 1e6
+                )
+            )
+
+
+def bench_cache(n_rows=50000, cache_size=1000):
+    """
+    Measure the time of validating low and high cardinality columns with and without column cache
+    """
+    from pycsvschema.checker import Validator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cardinality.csv')
+        with open(path, 'w') as f:
+            f.write('country,amount,ip,id\n')
+            for i in range(n_rows):
+                f.write('{0},{1}.5,10.0.0.{2},{3}\n'.format(('US', 'DE', 'FR')[i % 3], i % 100, i % 200, i))
+
+        def schema():
+            return {
+                'fields': [
+                    {'name': 'country', 'type': 'string', 'enum': ['US', 'DE']},
+                    {'name': 'amount', 'type': 'number', 'minimum': 0},
+                    {'name': 'ip', 'type': 'string', 'format': 'ipv4'},
+                    {'name': 'id', 'type': 'number'},
+                ],
+                'definitions': {},
+                'patternFields': {}
+            }
+
+        for size in (0, cache_size):
+            validator = Validator(path, schema(), output=os.devnull, errors='coerce', cache_size=size)
+            t = min(timeit.repeat(validator.validate, number=1, repeat=3))
+            print("cache: cache_size={0} {1:.2f} us per row".format(size, t / n_rows * 1e6))
+            for stats in validator.cache_stats().values():
+                print(
+                    "cache: column {column} hit rate {hit_rate:.2%}, enabled {enabled}".format(**stats)
+                )
+
+
+def check_batch_in_process(run, start, batch):
+    return [str(error) for error in run.check_rows(batch, start=start)]
+
+
+def validate_in_processes(validator, workers):
+    """
+    Validate with batches checked in a process pool, where the validator is pickled for every batch
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from pycsvschema import _utilities
+
+    run = validator.new_run()
+    with open(run.csvfile, 'r') as csvfile:
+        csv_reader = csv.reader(csvfile, **run.csv_pars)
+        run.header = next(csv_reader)
+        run.prepare_field_schema()
+        errors = [str(error) for error in run.check_header()]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = []
+            start = 0
+            for batch in _utilities.step_slice(csv_reader, run.batch_size):
+                futures.append(executor.submit(check_batch_in_process, run, start, batch))
+                start += len(batch)
+            for future in futures:
+                errors.extend(future.result())
+    return errors
+
+
+def bench_workers(n_rows=50000, workers=4):
+    """
+    Measure the time of validating rows in a single thread, a thread pool and a process pool
+    """
+    from pycsvschema.checker import Validator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rows.csv')
+        with open(path, 'w') as f:
+            f.write('id,email,amount,flag\n')
+            for i in range(n_rows):
+                f.write('{0},user{0}@example.com,{1}.25,{2}\n'.format(i, i % 1000, ('true', 'false')[i % 2]))
+
+        schema = {
+            'fields': [
+                {'name': 'id', 'type': 'number', 'minimum': 0},
+                {'name': 'email', 'type': 'string', 'format': 'email'},
+                {'name': 'amount', 'type': 'number', 'maximum': 10000},
+                {'name': 'flag', 'type': 'boolean'},
+            ],
+            'definitions': {},
+            'patternFields': {}
+        }
+        validator = Validator(path, schema, output=os.devnull, errors='coerce')
+        threaded = Validator(path, schema, output=os.devnull, errors='coerce', check_schema=False, workers=workers)
+
+        cases = [
+            ('single thread', validator.validate),
+            ('{0} threads'.format(workers), threaded.validate),
+            ('{0} processes'.format(workers), lambda: validate_in_processes(validator, workers)),
+        ]
+        for name, func in cases:
+            t = min(timeit.repeat(func, number=1, repeat=3))
+            print("workers: {0} {1:.2f} us per row".format(name, t / n_rows * 1e6))
+
+
+def bench_rules(n_rows=100000):
+    """
+    Measure the time of checking a row rule row by row and in a batch
+    """
+    from pycsvschema.validators.rules import RowRule
+
+    rule = RowRule({'expression': "end_date >= start_date and (status != 'closed' or closed_at is not null)"})
+    rows = [
+        {'start_date': '2020-01-01', 'end_date': '2020-02-{0:02d}'.format(i % 28 + 1), 'status': 'closed',
+         'closed_at': '2020-03-01'} for i in range(n_rows)
+    ]
+
+    cases = [
+        ('row by row', lambda: [rule.check(row) for row in rows]),
+        ('batch', lambda: rule.check_many(rows)),
+    ]
+    for name, func in cases:
+        t = min(timeit.repeat(func, number=1, repeat=5))
+        print("rules: {0} {1:.0f} ns per row".format(name, t / n_rows * 1e9))
+
+
+def bench_progress(n_rows=50000):
+    """
+    Measure the overhead of progress reporting
+    """
+    from pycsvschema.checker import Validator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rows.csv')
+        with open(path, 'w') as f:
+            f.write('id,amount\n')
+            for i in range(n_rows):
+                f.write('{0},{1}.25\n'.format(i, i % 1000))
+
+        schema = {
+            'fields': [{'name': 'id', 'type': 'number'}, {'name': 'amount', 'type': 'number'}],
+            'definitions': {},
+            'patternFields': {}
+        }
+        reports = []
+        for progress in (None, reports.append):
+            validator = Validator(path, schema, check_schema=False, progress=progress, progress_interval=0.1)
+            t = min(timeit.repeat(validator.validate, number=1, repeat=5))
+            print("progress: progress={0} {1:.2f} us per row".format(progress is not None, t / n_rows * 1e6))
+
+
+BENCHMARKS = [
+    bench_startup, bench_construct, bench_artifact, bench_numeric, bench_projection, bench_cache, bench_workers,
+    bench_rules, bench_progress
+]
+
+if __name__ == '__main__':
+    for benchmark in BENCHMARKS:
+        benchmark()
@@ -1,9 +1,14 @@
 #!/usr/bin/python
 # -*-coding: utf-8 -*-
 
+import collections
 import contextlib
+import csv
+import functools
+import re
 import sys
-from pycsvschema.validators import row_validators
+from pycsvschema.validators import row_validators, types
+from pycsvschema import defaults
 from itertools import islice
 
 
@@ -15,6 +20,10 @@ def file_writer(file_name=None):
         writer.close()
 
 
+def noop(*args):
+    pass
+
+
 def find_row_validators(column_info, field_schema):
     """
     Go through the options in field_schema, fetch the validators and add them into column_info['validators']
@@ -22,14 +31,216 @@ def find_row_validators(column_info, field_schema):
     if '$ref' in field_schema.keys():
         column_info['ref'] = field_schema['$ref']
     # Otherwise, make sure type checking is the first one
+    # Type validator is shared by all cells of the field, it doesn't keep state of cells
     else:
-        column_info['validators'] = [row_validators.field_type]
+        type_validator = types.TYPE_MAPPER[field_schema.get('type', defaults.FIELDS_TYPE)](field_schema=field_schema)
+        column_info['validators'] = [functools.partial(row_validators.field_type, type_validator=type_validator)]
         for field_option in field_schema.keys():
             validator = row_validators.ROW_OPTIONS.get(field_option)
             if validator is not None:
                 column_info['validators'].append(validator)
 
 
+def prepare_schema_validators(schema):
+    """
+    Prepare validators for every field schema in `fields`, `definitions` and `patternFields` of schema, resolving
+    `$ref` to the field schema in `definitions`, and compile `rowRules`. It only depends on schema, so it could be
+    reused among CSV files.
+
+    Sample schema_validators
+    {
+        'fields': [
+            {
+                'column': '<COLUMN_NAME>',
+                'field_schema': {'name':'id', 'type': 'number'},
+                'validators': [...]
+            }
+        ],
+        'definitions': {
+            'ref1': {'field_schema': {'type': 'number'}, 'validators': [...]}
+        },
+        'patternfields': {
+            '<PATTERN>': {'field_schema': {'type': 'number'}, 'validators': [...], 'regex': re.compile('<PATTERN>')}
+        },
+        'rowrules': [<rules.RowRule>]
+    }
+    """
+    schema_validators = {'fields': [], 'definitions': {}, 'patternfields': {}, 'rowrules': []}
+
+    for ref_name, field_schema in schema.get('definitions', defaults.DEFINITIONS).items():
+        column_info = {'field_schema': field_schema}
+        find_row_validators(column_info=column_info, field_schema=field_schema)
+        schema_validators['definitions'][ref_name] = column_info
+
+    for field_schema in schema.get('fields', defaults.FIELDS):
+        column_info = {'field_schema': field_schema, 'column': field_schema['name']}
+        find_row_validators(column_info=column_info, field_schema=field_schema)
+        resolve_ref(column_info, schema_validators['definitions'])
+        schema_validators['fields'].append(column_info)
+
+    for pattern, field_schema in schema.get('patternFields', defaults.PATTERNFIELDS).items():
+        column_info = {'field_schema': field_schema, 'regex': re.compile(pattern)}
+        find_row_validators(column_info=column_info, field_schema=field_schema)
+        resolve_ref(column_info, schema_validators['definitions'])
+        schema_validators['patternfields'][pattern] = column_info
+
+    if schema.get('rowRules', defaults.ROWRULES):
+        # ast and tokenize are only imported for schemas with row rules
+        from pycsvschema.validators import rules
+
+        for rule in schema['rowRules']:
+            schema_validators['rowrules'].append(rules.RowRule(rule))
+
+    return schema_validators
+
+
+def resolve_ref(column_info, definitions):
+    """
+    Update column_info with the prepared validators in definitions if it uses `$ref`
+    """
+    if column_info.get('ref') is None:
+        return
+
+    if column_info['ref'] not in definitions:
+        raise ValueError("Referencing undefined field")
+
+    column_info.update(definitions[column_info['ref']])
+
+
+class ColumnCache:
+    """
+    Bounded LRU cache of validation results for one column, mapping raw cell value to (converted value, errors)
+
+    Once the cache is full, hit rate is checked every `window` lookups. The cache is disabled and cleared if the hit
+    rate is lower than min_hit_rate in `patience` windows in a row, which means the column has too many distinct
+    values. Lookups before the cache is full are not checked, since they include the misses of filling the cache.
+    """
+
+    def __init__(self, maxsize, min_hit_rate=0.5, window=10000, patience=3):
+        self.maxsize = maxsize
+        self.min_hit_rate = min_hit_rate
+        self.window = window
+        self.patience = patience
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.results = collections.OrderedDict()
+        self._window_hits = 0
+        self._window_lookups = 0
+        self._low_windows = 0
+
+    def get(self, key):
+        result = self.results.get(key)
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(key)
+
+        if len(self.results) >= self.maxsize:
+            self._window_lookups += 1
+            if result is not None:
+                self._window_hits += 1
+
+            if self._window_lookups >= self.window:
+                if self._window_hits < self.min_hit_rate * self._window_lookups:
+                    self._low_windows += 1
+                else:
+                    self._low_windows = 0
+
+                if self._low_windows >= self.patience:
+                    self.enabled = False
+                    self.results.clear()
+                self._window_hits = self._window_lookups = 0
+
+        return result
+
+    def put(self, key, result):
+        if not self.enabled:
+            return
+
+        self.results[key] = result
+        if len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.results),
+            'enabled': self.enabled
+        }
+
+
+class LineFeeder:
+    """
+    Line iterator for csv.reader, which returns the pushed line first, then continues reading from file, in case
+    quoted fields span multiple lines
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.line = None
+
+    def push(self, line):
+        self.line = line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.line is not None:
+            line, self.line = self.line, None
+            return line
+        return next(self.f)
+
+
+def projected_reader(f, indexes, count_fields=False, **csv_pars):
+    """
+    Yield (cells at indexes, number of fields) for every row in f. Number of fields is None if count_fields is False,
+    unless the row is too short to have all indexes, then cells is None.
+
+    Lines without quotechar or escapechar are split by delimiter only up to the last index, other lines are parsed by
+    csv.reader.
+    """
+    feeder = LineFeeder(f)
+    reader = csv.reader(feeder, **csv_pars)
+
+    delimiter = csv_pars.get('delimiter', ',')
+    quotechar = csv_pars.get('quotechar', '"')
+    escapechar = csv_pars.get('escapechar')
+    quoting = csv_pars.get('quoting', csv.QUOTE_MINIMAL)
+    if quoting == csv.QUOTE_NONE:
+        quotechar = None
+
+    # Initial spaces and unquoted numbers are only handled by csv.reader
+    fast = not csv_pars.get('skipinitialspace', False) and quoting != csv.QUOTE_NONNUMERIC
+    min_length = maxsplit = max(indexes) + 1 if indexes else 0
+
+    for line in f:
+        if fast and (quotechar is None or quotechar not in line) and (escapechar is None or escapechar not in line):
+            line = line.rstrip('\r\n')
+            # csv.reader returns no field for empty line
+            if not line:
+                fields = []
+                field_count = 0
+            else:
+                fields = line.split(delimiter, maxsplit)
+                field_count = line.count(delimiter) + 1 if count_fields else None
+        else:
+            feeder.push(line)
+            fields = next(reader)
+            field_count = len(fields)
+
+        if len(fields) < min_length:
+            yield None, len(fields)
+        else:
+            yield [fields[i] for i in indexes], field_count
+
+
 def step_slice(g, step):
     """Yield successive step-sized chunks from generator."""
     while True:
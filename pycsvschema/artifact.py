@@ -0,0 +1,121 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Schema artifact is a binary file storing the validated and updated schema with the validators prepared from it, so
+# that new processes could create Validator without validating and preparing the schema again.
+#
+# Artifact file layout:
+#   MAGIC, ARTIFACT_VERSION and the sha256 hash of the normalized source schema, one per line, followed by a pickle of
+#   {'schema': <updated schema>, 'schema_validators': <Validator.schema_validators>}
+#
+# Artifact is loaded by pickle, so only load artifacts from trusted sources.
+
+import copy
+import hashlib
+import json
+import pickle
+from pycsvschema import defaults
+from typing import Dict, Optional
+
+MAGIC = b'PYCSVSCHEMA-ARTIFACT'
+ARTIFACT_VERSION = 5
+
+# Keywords in field schemas whose lists are converted into sets by Validator.update_schema
+SET_KEYWORDS = ('trueValues', 'falseValues', 'enum')
+
+
+def sorted_values(values):
+    return sorted(set(values), key=lambda v: json.dumps(v, sort_keys=True))
+
+
+def normalize_schema(schema: Dict) -> Dict:
+    """
+    Copy of schema as updated by Validator.update_schema, with sets as sorted lists, so that a raw schema and the same
+    schema already passed to Validator are hashed the same
+    """
+    schema = copy.deepcopy(schema)
+    schema['missingValues'] = sorted_values(schema.get('missingValues', defaults.MISSINGVALUES))
+
+    fields_schema_with_array = (
+        schema.get('fields', []), schema.get('definitions', {}).values(), schema.get('patternFields', {}).values()
+    )
+    for fields in fields_schema_with_array:
+        for field in fields:
+            for k in SET_KEYWORDS:
+                if k in field:
+                    field[k] = sorted_values(field[k])
+    return schema
+
+
+def schema_hash(schema: Dict) -> str:
+    """
+    Hash of the normalized CSV Schema content, which does not depend on the order of keys and of values in
+    missingValues, trueValues, falseValues and enum
+    """
+    content = json.dumps(normalize_schema(schema), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def save_artifact(schema: Dict, path: str, check_schema: bool = True):
+    """
+    Validate and prepare schema, and save it to an artifact file
+
+    :param schema: CSV Schema in dict. It is not modified.
+    :param path: Path to the artifact file
+    :param check_schema: Validate schema against the meta-schema. Default: True.
+    """
+    from pycsvschema.checker import Validator
+
+    source_hash = schema_hash(schema)
+    validator = Validator(csvfile=None, schema=copy.deepcopy(schema), check_schema=check_schema)
+
+    with open(path, 'wb') as f:
+        f.write(b'\n'.join((MAGIC, str(ARTIFACT_VERSION).encode('ascii'), source_hash.encode('ascii'), b'')))
+        pickle.dump(
+            {'schema': validator.schema, 'schema_validators': validator.schema_validators},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+
+def read_artifact_header(f):
+    """
+    Read magic, version and source schema hash from an opened artifact file
+    """
+    if f.readline().rstrip(b'\n') != MAGIC:
+        raise ValueError("File is not a schema artifact")
+
+    version = int(f.readline())
+    if version != ARTIFACT_VERSION:
+        raise ValueError(
+            "Unsupported artifact version {0}, expected version {1}".format(version, ARTIFACT_VERSION)
+        )
+
+    return f.readline().rstrip(b'\n').decode('ascii')
+
+
+def is_stale(path: str, source_schema: Dict) -> bool:
+    """
+    Whether the artifact is not saved from source_schema, which could be the raw schema or the same dict already
+    passed to Validator
+    """
+    with open(path, 'rb') as f:
+        return read_artifact_header(f) != schema_hash(source_schema)
+
+
+def load_artifact(path: str, source_schema: Optional[Dict] = None) -> Dict:
+    """
+    Load the updated schema and validators from an artifact file
+
+    :param path: Path to the artifact file
+    :param source_schema: CSV Schema in dict. If it's provided, raise ValueError when the artifact is not saved from
+    source_schema.
+    :return: {'schema': <updated schema>, 'schema_validators': <Validator.schema_validators>}
+    """
+    with open(path, 'rb') as f:
+        source_hash = read_artifact_header(f)
+
+        if source_schema is not None and source_hash != schema_hash(source_schema):
+            raise ValueError("Artifact {0} is stale, the source schema has changed".format(path))
+
+        return pickle.load(f)
@@ -1,13 +1,36 @@
 #!/usr/bin/python
 # -*-coding: utf-8 -*-
 
+import collections
+import copy
 import csv
+import heapq
 from itertools import chain
-import json
-import jsonschema
+import os
+import threading
 from pycsvschema.validators import header_validators
-from pycsvschema import defaults, _utilities
-from typing import Dict, Optional
+from pycsvschema import defaults, exceptions, _utilities
+from typing import Callable, Dict, List, Optional
+
+
+META_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema.json')
+
+# Meta-schema validator is built on first use and shared by all validators
+_meta_schema_validator = None
+
+
+def get_meta_schema_validator():
+    global _meta_schema_validator
+    if _meta_schema_validator is None:
+        import json
+        import jsonschema
+
+        with open(META_SCHEMA_PATH, 'r') as f:
+            meta_schema = json.load(f)
+        validator_class = jsonschema.validators.validator_for(meta_schema)
+        validator_class.check_schema(meta_schema)
+        _meta_schema_validator = validator_class(meta_schema)
+    return _meta_schema_validator
 
 
 class Validator:
@@ -22,13 +45,64 @@ class Validator:
         'strict': False
     }
 
-    def __init__(self, csvfile: str, schema: Dict, output: Optional[str] = None, errors: str = 'raise', **kwargs):
+    def __init__(
+        self,
+        csvfile: str,
+        schema: Dict,
+        output: Optional[str] = None,
+        errors: str = 'raise',
+        check_schema: bool = True,
+        schema_validators: Optional[Dict] = None,
+        projection: bool = False,
+        check_field_count: bool = False,
+        cache_size: int = 0,
+        cache_columns: Optional[List[str]] = None,
+        cache_window: int = 10000,
+        cache_min_hit_rate: float = 0.5,
+        workers: int = 1,
+        batch_size: int = 10000,
+        progress: Optional[Callable[[Dict], None]] = None,
+        progress_interval: float = 1.0,
+        progress_every: int = 1000,
+        **kwargs
+    ):
         """
         :param csvfile: Path to CSV file
         :param schema: CSV Schema in dict
         :param output: Path to output file of errors. If output is None, print the error message. Default: None.
         :param error: {'raise', 'coerce'} If error is 'raise', stop the validation when it meets the first error. If
         error is 'coerce', output all errors.
+        :param check_schema: Validate schema against the meta-schema. Set it to False for schemas which are already
+        validated, to skip importing jsonschema and loading the meta-schema. Default: True.
+        :param schema_validators: Validators prepared from schema by _utilities.prepare_schema_validators. If it's
+        provided, schema is considered as validated and updated, and it is not prepared again. Default: None.
+        :param projection: Only read the cells of columns with validators, which is faster for wide CSV files.
+        Default: False.
+        :param check_field_count: Check whether every row has the same number of fields as header. Rows without
+        enough fields for the validated columns always fail the check. Cells in rows failing the check are not
+        validated. Default: False.
+        :param cache_size: Maximum number of distinct values whose validation results are cached per column, which
+        is faster for columns with few distinct values. Once the cache of a column is full, it is disabled if its hit
+        rate stays lower than cache_min_hit_rate for several windows of cache_window lookups. If cache_size is 0, cache
+        is disabled. Default: 0.
+        :param cache_columns: Names of columns to cache. If cache_columns is None, cache all columns. Default: None.
+        :param cache_window: Number of lookups in a window of checking the hit rate of column caches. Default: 10000.
+        :param cache_min_hit_rate: Minimum hit rate of column caches in a window. Default: 0.5.
+        :param workers: Number of threads to check rows. If workers is greater than 1, rows are read in batches of
+        batch_size rows and checked in a thread pool, which is faster on free-threaded Python. Errors are output in
+        the same order as single thread. Default: 1.
+        :param batch_size: Number of rows in a batch for the thread pool. Default: 10000.
+        :param progress: Callable accepting the progress of validation in dict, like bytes read, rows, errors,
+        rows/sec and ETA. See pycsvschema.progress for the keys, and ProgressBar and ProgressLogger as reporters. It's
+        called at most once every progress_interval seconds, and once when validation finishes or is aborted, with
+        status 'finished' or 'aborted'. Default: None.
+        :param progress_interval: Minimum seconds between two progress reports. Default: 1.0.
+        :param progress_every: Check the time for progress reports every progress_every rows. Default: 1000.
+
+        The prepared schema is shared and not modified by validation, while the state of each validation, like
+        header and column_validators, is kept in a copy of validator by new_run(), so one validator could validate
+        CSV files in several threads at the same time. The copy of the last validation is in self.last_run, and its
+        header, column_validators and column_caches are set on the validator after validation.
 
         Validator also accepts parameters of csv.reader, that includes delimiter, doublequote, escapechar,
         lineterminator, quotechar, quoting, skipinitialspace and strict
@@ -45,6 +119,33 @@ class Validator:
             raise ValueError("Unknown value for parameter errors")
         self.errors = errors
 
+        self.projection = projection
+
+        self.check_field_count = check_field_count
+
+        self.cache_size = cache_size
+
+        self.cache_columns = cache_columns
+
+        self.cache_window = cache_window
+
+        self.cache_min_hit_rate = cache_min_hit_rate
+
+        self.workers = workers
+
+        self.batch_size = batch_size
+
+        self.progress = progress
+
+        self.progress_interval = progress_interval
+
+        self.progress_every = progress_every
+
+        # Sample column_caches [{<COLUMN_INDEX>: <ColumnCache>}], one dict for every thread checking rows
+        self.column_caches = []
+
+        self.last_run = None
+
         self.header = []
 
         self.csv_pars = {
@@ -55,13 +156,50 @@ class Validator:
 
         self.column_validators = {'columns': {}, 'unfoundfields': {}}
 
-        self.validate_schema()
+        if schema_validators is None:
+            if check_schema:
+                self.validate_schema()
+
+            self.update_schema()
+
+            schema_validators = _utilities.prepare_schema_validators(self.schema)
+        self.schema_validators = schema_validators
+
+    @classmethod
+    def from_artifact(
+        cls,
+        csvfile: str,
+        artifact: str,
+        output: Optional[str] = None,
+        errors: str = 'raise',
+        source_schema: Optional[Dict] = None,
+        **kwargs
+    ):
+        """
+        Create Validator from a schema artifact saved by pycsvschema.artifact.save_artifact
 
-        self.update_schema()
+        :param artifact: Path to the artifact file
+        :param source_schema: CSV Schema in dict, which the artifact is saved from. If it's provided, raise ValueError
+        when the artifact is stale.
+        """
+        from pycsvschema import artifact as _artifact
+
+        prepared = _artifact.load_artifact(artifact, source_schema=source_schema)
+        return cls(
+            csvfile,
+            prepared['schema'],
+            output=output,
+            errors=errors,
+            schema_validators=prepared['schema_validators'],
+            **kwargs
+        )
 
     def validate_schema(self):
-        meta_schema = json.load(open('pycsvschema/schema.json', 'r'))
-        jsonschema.validate(self.schema, meta_schema)
+        import jsonschema
+
+        error = jsonschema.exceptions.best_match(get_meta_schema_validator().iter_errors(self.schema))
+        if error is not None:
+            raise error
 
     def update_schema(self):
         # Convert list in schema into set
@@ -81,22 +219,82 @@ class Validator:
                     if k in field.keys():
                         field[k] = set(field[k])
 
+    def new_run(self):
+        """
+        Copy the validator with empty state of validation, which shares the prepared schema with the validator
+        """
+        run = copy.copy(self)
+        run.header = []
+        run.column_validators = {'columns': {}, 'unfoundfields': {}}
+        run.column_caches = []
+        run.last_run = None
+        return run
+
     def validate(self):
+        run = self.new_run()
+        self.last_run = run
+        try:
+            run.check_file()
+        finally:
+            # State of the last validation is kept on the validator too, like when validation ran on the validator
+            self.header = run.header
+            self.column_validators = run.column_validators
+            self.column_caches = run.column_caches
+
+    def check_file(self):
         with open(self.csvfile, 'r') as csvfile:
             csv_reader = csv.reader(csvfile, **self.csv_pars)
 
+            tracker = None
+            callback = _utilities.noop
+            tell = None
+            if self.progress is not None:
+                from pycsvschema import progress
+
+                # Position of the binary buffer is the bytes read, including the read-ahead of text decoding
+                tracker = progress.ProgressTracker(
+                    self.progress,
+                    f=csvfile.buffer,
+                    total_bytes=os.fstat(csvfile.fileno()).st_size,
+                    interval=self.progress_interval,
+                    every=self.progress_every
+                )
+                callback = tracker.update
+                tell = tracker.tell
+
             # Read first line as header
             self.header = next(csv_reader)
             self.prepare_field_schema()
 
+            if self.projection:
+                rows = self.read_projected_rows(csvfile)
+            else:
+                rows = csv_reader
+
             with _utilities.file_writer(self.output) as output:
                 # Concat errors from header checking and row checking
-                for error in chain(self.check_header(), self.check_rows(csv_reader)):
-                    if self.errors == 'raise':
-                        raise error
-                    else:
-                        output.write(str(error))
-                        output.write('\n')
+                if self.workers > 1:
+                    row_errors = self.check_rows_threaded(rows, callback=callback, projected=self.projection, tell=tell)
+                else:
+                    row_errors = self.check_rows(rows, callback=callback, projected=self.projection)
+
+                completed = False
+                try:
+                    for error in chain(self.check_header(), row_errors):
+                        if tracker is not None:
+                            tracker.errors += 1
+
+                        if self.errors == 'raise':
+                            raise error
+                        else:
+                            output.write(str(error))
+                            output.write('\n')
+                    completed = True
+                finally:
+                    # Stop the thread pool of check_rows_threaded now, instead of when the generator is collected
+                    row_errors.close()
+                    if tracker is not None:
+                        tracker.finish(aborted=not completed)
 
     def prepare_field_schema(self):
         """
@@ -104,6 +302,7 @@ class Validator:
 
         Sample self.column_validators
         {
+            'fields': [<self.schema_validators['fields']>],
             'columns':{
                 0: {
                     'column': '<COLUMN_NAME>',
@@ -156,41 +355,286 @@ class Validator:
             else:
                 header_index[v] = [k]
 
-        for field_schema in self.schema.get('fields', defaults.FIELDS):
-            column_info = {'field_schema': field_schema, 'column': field_schema['name']}
+        # Validators are prepared from schema, header validators only copy them to columns
+        self.column_validators['fields'] = self.schema_validators['fields']
+        self.column_validators['definitions'] = self.schema_validators['definitions']
+        self.column_validators['patternfields'] = self.schema_validators['patternfields']
+        self.column_validators['rowrules'] = self.schema_validators['rowrules']
 
-            _utilities.find_row_validators(column_info=column_info, field_schema=field_schema)
+        for field_info in self.schema_validators['fields']:
+            column_info = dict(field_info)
 
             # Pass the validators to one or more than one columns
-            if field_schema['name'] in header_index.keys():
-                for column_index in header_index[field_schema['name']]:
+            if column_info['column'] in header_index.keys():
+                for column_index in header_index[column_info['column']]:
                     self.column_validators['columns'][column_index] = column_info
             # Store the unfound field names in column_validators.unfoundfields
             else:
-                self.column_validators['unfoundfields'][field_schema['name']] = column_info
+                self.column_validators['unfoundfields'][column_info['column']] = column_info
 
     def check_header(self):
         for validator_name, validator in header_validators.HEADER_OPTIONS.items():
             if validator_name in self.schema:
                 yield from validator(self.header, self.schema, self.column_validators)
 
+        # Row rules are checked after columns get their field schemas
+        yield from header_validators.rowrules(self.header, self.schema, self.column_validators)
+
         yield from header_validators.field_required(self.header, self.schema, self.column_validators)
 
-    def check_rows(self, csvreader, callback=lambda *args: None):
-        for line_num, row in enumerate(csvreader):
-            for index, column_info in self.column_validators['columns'].items():
-                c = {'value': row[index], 'row': line_num + 1, 'column': self.header[index]}
+    def read_indexes(self):
+        """
+        Indexes of columns which are read from rows, which are the columns in self.column_validators['columns']
+        """
+        return list(self.column_validators['columns'])
+
+    def read_projected_rows(self, csvfile):
+        """
+        Read rows after header with only cells of columns in read_indexes()
+
+        It's a generator, so columns are collected after header checking, when reading the first row
+        """
+        yield from _utilities.projected_reader(
+            csvfile, self.read_indexes(), count_fields=self.check_field_count, **self.csv_pars
+        )
 
-                # Update c.value to None if value is in missingValues
-                yield from header_validators.missingvalues(c, self.schema, self.column_validators)
+    def new_column_caches(self):
+        column_caches = {}
+        if self.cache_size > 0:
+            for index in self.column_validators['columns']:
+                if self.cache_columns is None or self.header[index] in self.cache_columns:
+                    column_caches[index] = _utilities.ColumnCache(
+                        maxsize=self.cache_size, min_hit_rate=self.cache_min_hit_rate, window=self.cache_window
+                    )
 
-                for validator in column_info['validators']:
-                    # Type validator convert cell value into target type, other validators don't accept None value
-                    # if validator is row_validators.field_type or c['value'] is not None:
-                    yield from validator(c, self.schema, column_info['field_schema'])
+        self.column_caches.append(column_caches)
+        return column_caches
+
+    def check_rows_threaded(self, csvreader, callback=_utilities.noop, projected=False, tell=None):
+        """
+        Check rows in batches by a thread pool of self.workers threads, and yield errors of batches in order
+
+        Rows are read in the calling thread, every thread has its own column caches. callback is called in the
+        calling thread with the last row of every batch, after errors of the batch are yielded.
+
+        :param tell: Callable returning the position of file. Rows are read ahead of checking, so the position
+        after every batch is read is passed to callback with the batch, instead of the position when it's called.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        local = threading.local()
+
+        def check_batch(start, batch):
+            if not hasattr(local, 'column_caches'):
+                local.column_caches = self.new_column_caches()
+
+            # Row rules are checked on the whole batch, then their errors are merged with cell errors by row
+            rule_rows = []
+            errors = list(
+                self.check_rows(
+                    batch, projected=projected, start=start, column_caches=local.column_caches, rule_rows=rule_rows
+                )
+            )
+            if not rule_rows:
+                return errors
+            return list(heapq.merge(errors, self.check_row_rules(rule_rows), key=lambda error: error.row))
+
+        def batch_errors(future, start, batch, position):
+            yield from future.result()
+            callback(start + len(batch) - 1, batch[-1], position)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # Limit the batches in memory
+            futures = collections.deque()
+            start = 0
+            try:
+                for batch in _utilities.step_slice(iter(csvreader), self.batch_size):
+                    position = tell() if tell is not None else None
+                    futures.append((executor.submit(check_batch, start, batch), start, batch, position))
+                    start += len(batch)
+
+                    if len(futures) >= 2 * self.workers:
+                        yield from batch_errors(*futures.popleft())
+
+                while futures:
+                    yield from batch_errors(*futures.popleft())
+            finally:
+                # Stop pending batches when errors='raise' stops the validation
+                for future, _, _, _ in futures:
+                    future.cancel()
+
+    def check_rows(
+        self, csvreader, callback=_utilities.noop, projected=False, start=0, column_caches=None, rule_rows=None
+    ):
+        """
+        :param csvreader: Iterator of rows. If projected is True, it yields (cells, number of fields) like
+        read_projected_rows, where cells are ordered as read_indexes().
+        :param start: Index of the first row in csvreader, rows are numbered from 1. Default: 0.
+        :param column_caches: Column caches created by new_column_caches. If it's None, create new caches.
+        :param rule_rows: If it's a list, row rules are not checked row by row, instead (row index, typed values,
+        fields failing type conversion) of every row is appended to it for check_row_rules. Default: None.
+
+        Rows which are too short for the read columns fail field count checking.
+        Row rules are checked after the cells of a row, with the typed values of cells. A rule is not checked on a
+        row if a field it references fails type conversion, which is already reported as an error of the cell.
+        """
+        if column_caches is None:
+            column_caches = self.new_column_caches()
+
+        indexes = self.read_indexes()
+        positions = {index: position if projected else index for position, index in enumerate(indexes)}
+
+        # Sample rule_fields {<COLUMN_INDEX>: '<FIELD_NAME>'}
+        rule_fields = {}
+        for rule, fields in self.column_validators.get('rowrulecolumns', []):
+            rule_fields.update({index: field for field, index in fields.items()})
+        rules = [rule for rule, fields in self.column_validators.get('rowrulecolumns', [])]
+
+        # Sample columns [(<INDEX_IN_ROW>, <COLUMN_NAME>, <COLUMN_INFO>, <COLUMN_CACHE>, <RULE_FIELD_NAME>),]
+        columns = [
+            (positions[index], self.header[index], column_info, column_caches.get(index), rule_fields.get(index))
+            for index, column_info in self.column_validators['columns'].items()
+        ]
+        missing_values = self.schema.get('missingValues', defaults.MISSINGVALUES)
+
+        header_length = len(self.header)
+        min_length = max(indexes) + 1 if indexes else 0
+
+        for line_num, row in enumerate(csvreader, start):
+            if projected:
+                row, field_count = row
+            else:
+                field_count = len(row)
+
+            # Projected rows only have number of fields when it's counted or the row is too short
+            if field_count is not None and (
+                field_count < min_length or (self.check_field_count and field_count != header_length)
+            ):
+                yield exceptions.ValidationError(
+                    message="Row has {0} fields while header has {1} fields".format(field_count, header_length),
+                    row=line_num + 1
+                )
+                callback(line_num, row)
+                continue
+
+            # Typed values of fields referenced by row rules, and the fields failing type conversion
+            values = {}
+            failed = []
+
+            for index, column, column_info, cache, field in columns:
+                value = row[index]
+
+                if cache is None or not cache.enabled:
+                    c = {'value': value, 'row': line_num + 1, 'column': column}
+                    yield from self.check_cell(c, column_info)
+                    if field is not None:
+                        values[field] = c['value']
+                        if c['value'] is None and value not in missing_values:
+                            failed.append(field)
+                    continue
+
+                # Cached results only depend on the raw value, errors are created again with row number
+                result = cache.get(value)
+                if result is None:
+                    c = {'value': value, 'row': line_num + 1, 'column': column}
+                    errors = list(self.check_cell(c, column_info))
+                    result = (c['value'], [(error.message, error.column) for error in errors])
+                    cache.put(value, result)
+
+                for message, error_column in result[1]:
+                    yield exceptions.ValidationError(message=message, column=error_column, row=line_num + 1)
+                if field is not None:
+                    values[field] = result[0]
+                    if result[0] is None and value not in missing_values:
+                        failed.append(field)
+
+            if rules:
+                if rule_rows is not None:
+                    rule_rows.append((line_num, values, failed))
+                else:
+                    for rule in rules:
+                        if failed and not rule.fields_set.isdisjoint(failed):
+                            continue
+                        try:
+                            satisfied = rule.check(values)
+                        except exceptions.ValidationError as error:
+                            error.row = line_num + 1
+                            yield error
+                            continue
+                        if not satisfied:
+                            yield exceptions.ValidationError(
+                                message="Row does not satisfy rule {0}".format(rule.name), row=line_num + 1
+                            )
 
             callback(line_num, row)
 
+    def check_row_rules(self, rule_rows):
+        """
+        Check row rules on a batch of rows by RowRule.check_many, and yield errors in the same order as check_rows
+
+        :param rule_rows: List of (row index, typed values, fields failing type conversion) collected by check_rows
+        """
+        # Sample rule_results [{<ROW_INDEX>: <RESULT>}], results of every rule which is not satisfied on the row, False
+        # or the exceptions.ValidationError of evaluation
+        rule_results = []
+        for rule, fields in self.column_validators.get('rowrulecolumns', []):
+            checked = [
+                (line_num, values) for line_num, values, failed in rule_rows
+                if not failed or rule.fields_set.isdisjoint(failed)
+            ]
+            results = rule.check_many([values for line_num, values in checked])
+            rule_results.append(
+                {line_num: result for (line_num, values), result in zip(checked, results) if result is not True}
+            )
+
+        rules = [rule for rule, fields in self.column_validators.get('rowrulecolumns', [])]
+        for line_num, values, failed in rule_rows:
+            for rule, results in zip(rules, rule_results):
+                if line_num not in results:
+                    continue
+                error = results[line_num]
+                if error is False:
+                    error = exceptions.ValidationError(message="Row does not satisfy rule {0}".format(rule.name))
+                error.row = line_num + 1
+                yield error
+
+    def check_cell(self, c, column_info):
+        # Update c.value to None if value is in missingValues
+        yield from header_validators.missingvalues(c, self.schema, self.column_validators)
+
+        for validator in column_info['validators']:
+            # Type validator convert cell value into target type, other validators don't accept None value
+            # if validator is row_validators.field_type or c['value'] is not None:
+            yield from validator(c, self.schema, column_info['field_schema'])
+
+    def cache_stats(self):
+        """
+        Statistics of column caches in the last validation, summed over threads. Column is enabled if it's enabled in
+        any thread.
+
+        Sample cache_stats
+        {
+            0: {'column': '<COLUMN_NAME>', 'hits': 10, 'misses': 2, 'hit_rate': 0.83, 'size': 2, 'enabled': True}
+        }
+        """
+        run = self if self.last_run is None else self.last_run
+
+        stats = {}
+        for column_caches in run.column_caches:
+            for index, cache in column_caches.items():
+                cache_stats = cache.stats()
+                if index not in stats:
+                    stats[index] = {'column': run.header[index], **cache_stats}
+                    continue
+                for k in ('hits', 'misses', 'size'):
+                    stats[index][k] += cache_stats[k]
+                stats[index]['enabled'] = stats[index]['enabled'] or cache_stats['enabled']
+
+        for column_stats in stats.values():
+            lookups = column_stats['hits'] + column_stats['misses']
+            column_stats['hit_rate'] = column_stats['hits'] / lookups if lookups else 0.0
+        return stats
+
 
 class CSV2JSON(Validator):
     def __init__(self, csvfile: str, schema: Dict, output: Optional[str], **kwargs):
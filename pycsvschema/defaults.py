@@ -13,6 +13,7 @@ EXACTFIELDS = False
 # MINFIELDS = 0
 MISSINGVALUES = ['']
 PATTERNFIELDS = {}
+ROWRULES = []
 
 # field
 FIELDS_ENUM = []
@@ -25,6 +26,8 @@ FIELDS_EXCLUSIVEMININUM = False
 FIELDS_TYPE = 'string'
 FIELDS_FORMAT = ''
 FIELDS_GROUPCHAR = ''
+FIELDS_DECIMALCHAR = '.'
+FIELDS_BARENUMBER = True
 FIELDS_TRUEVALUES = {'TRUE', 'True', 'true', '1'}
 FIELDS_FALSEVALUES = {'FALSE', 'False', 'false', '0'}
 FIELDS_FORMAT_DATETIME_PATTERN = '%Y-%m-%dT%H:%M:%S.%f%z'
@@ -0,0 +1,183 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Progress reporting of Validator.validate
+#
+# Validator calls ProgressTracker.update for every row, which only checks the time every `every` rows, and reports
+# the progress to a reporter when `interval` seconds have passed since the last report. A reporter is a callable
+# accepting the progress in dict:
+# {
+#     'bytes_read': 1048576,
+#     'total_bytes': 10485760,
+#     'rows': 20000,
+#     'errors': 3,
+#     'elapsed': 2.0,
+#     'rows_per_second': 10000.0,
+#     'bytes_per_second': 524288.0,
+#     'percent': 10.0,
+#     'eta': 18.0,
+#     'status': 'running',
+#     'finished': False
+# }
+# percent and eta are None if the size of file is unknown. status is 'running' until the last report, which is
+# 'finished' if all rows are validated, or 'aborted' if validation stops early, like errors='raise' meeting an error.
+# finished is True only for 'finished'.
+
+import logging
+import sys
+import threading
+import time
+
+
+class ProgressTracker:
+    def __init__(self, reporter, f=None, total_bytes=0, interval=1.0, every=1000):
+        """
+        :param reporter: Callable accepting the progress in dict
+        :param f: Binary file object being read, whose position is bytes read
+        :param total_bytes: Size of file, 0 if it's unknown
+        :param interval: Minimum seconds between two reports
+        :param every: Check the time every `every` rows
+        """
+        self.reporter = reporter
+        self.f = f
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self.every = every
+
+        self.rows = 0
+        self.errors = 0
+        # Bytes read up to the latest checked row, if rows are read ahead of checking
+        self.position = None
+        self.start_time = time.monotonic()
+        self.last_report = self.start_time
+        self.next_check = every
+        self.lock = threading.Lock()
+
+    def update(self, line_num, row=None, position=None):
+        """
+        Callback of Validator.check_rows, line_num is the index of the latest checked row
+
+        :param position: Position of file after the row is read, if rows are read ahead of checking like in
+        Validator.check_rows_threaded. Otherwise the current position of file is used.
+        """
+        self.rows = line_num + 1
+        if position is not None:
+            self.position = position
+        if self.rows < self.next_check:
+            return
+        self.next_check = self.rows + self.every
+
+        if time.monotonic() - self.last_report >= self.interval:
+            self.report()
+
+    def tell(self):
+        if self.f is None:
+            return 0
+        try:
+            return self.f.tell()
+        except (OSError, ValueError):
+            return 0
+
+    def bytes_read(self):
+        return self.tell() if self.position is None else self.position
+
+    def progress(self, status='running'):
+        now = time.monotonic()
+        elapsed = now - self.start_time
+        bytes_read = self.bytes_read()
+        bytes_per_second = bytes_read / elapsed if elapsed > 0 else 0.0
+
+        percent = eta = None
+        if self.total_bytes:
+            percent = min(100.0, bytes_read * 100.0 / self.total_bytes)
+            if bytes_per_second > 0:
+                eta = max(0.0, (self.total_bytes - bytes_read) / bytes_per_second)
+
+        return {
+            'bytes_read': bytes_read,
+            'total_bytes': self.total_bytes,
+            'rows': self.rows,
+            'errors': self.errors,
+            'elapsed': elapsed,
+            'rows_per_second': self.rows / elapsed if elapsed > 0 else 0.0,
+            'bytes_per_second': bytes_per_second,
+            'percent': percent,
+            'eta': {'finished': 0.0, 'aborted': None}.get(status, eta),
+            'status': status,
+            'finished': status == 'finished'
+        }
+
+    def report(self, status='running'):
+        with self.lock:
+            self.last_report = time.monotonic()
+            self.reporter(self.progress(status=status))
+
+    def finish(self, aborted=False):
+        """
+        Send the last report, with status 'aborted' if validation stops before all rows are validated
+        """
+        if not aborted:
+            # All rows are checked, so the rows read ahead are checked too
+            self.position = None
+        self.report(status='aborted' if aborted else 'finished')
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return '--:--:--'
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return '{0}:{1:02d}:{2:02d}'.format(hours, minutes, seconds)
+
+
+class ProgressBar:
+    """
+    Reporter showing a progress bar in one line of terminal, like
+    [##########----------]  50.0% 1000000 rows, 250000 rows/s, 3 errors, ETA 0:00:04
+    """
+
+    def __init__(self, stream=None, width=30):
+        self.stream = stream if stream is not None else sys.stderr
+        self.width = width
+
+    def __call__(self, progress):
+        if progress['percent'] is None:
+            bar = ''
+        else:
+            filled = int(self.width * progress['percent'] / 100)
+            bar = '[{0}{1}] {2:5.1f}% '.format('#' * filled, '-' * (self.width - filled), progress['percent'])
+
+        self.stream.write(
+            '\r{0}{1} rows, {2:.0f} rows/s, {3} errors, ETA {4}'.format(
+                bar, progress['rows'], progress['rows_per_second'], progress['errors'], format_seconds(progress['eta'])
+            )
+        )
+        if progress['status'] == 'aborted':
+            self.stream.write(' (aborted)')
+        if progress['status'] != 'running':
+            self.stream.write('\n')
+        self.stream.flush()
+
+
+class ProgressLogger:
+    """
+    Reporter logging the progress as structured log events, the progress dict is in the `progress` attribute of
+    log records
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger if logger is not None else logging.getLogger('pycsvschema.progress')
+        self.level = level
+
+    def __call__(self, progress):
+        self.logger.log(
+            self.level,
+            "Validation %s: %d rows, %.0f rows/s, %d errors, %s bytes read, ETA %s",
+            progress['status'],
+            progress['rows'],
+            progress['rows_per_second'],
+            progress['errors'],
+            progress['bytes_read'],
+            format_seconds(progress['eta']),
+            extra={'progress': progress}
+        )
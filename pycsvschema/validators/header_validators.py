@@ -30,29 +30,15 @@ def additionalfields(header, schema, column_validators):
 
 def definitions(header, schema, column_validators):
     """
-    definitions is not a validator, but only append schema in definitions to column_validators
+    definitions is not a validator, but only resolve `$ref` of columns with validators in
+    column_validators['definitions'], which are prepared by Validator
 
     Update validators for all fields using $ref keyword
 
     This should be the last root validator
     """
-    # Prepare schema in definitions and add it to column_validators
-    column_validators['definitions'] = {}
-    for ref_name, field_schema in schema['definitions'].items():
-        column_info = {
-            'field_schema': field_schema,
-        }
-
-        _utilities.find_row_validators(column_info=column_info, field_schema=field_schema)
-
-        column_validators['definitions'][ref_name] = column_info
-
     for column_info in chain(column_validators['columns'].values(), column_validators['unfoundfields'].values()):
-        if column_info.get('ref') is not None:
-            if column_info['ref'] not in schema['definitions'].keys():
-                raise ValueError("Referencing undefined field")
-
-            column_info.update(column_validators['definitions'][column_info['ref']])
+        _utilities.resolve_ref(column_info, column_validators['definitions'])
 
     yield from ()
 
@@ -84,11 +70,7 @@ def exactfields(header, schema, column_validators):
 
     column_validators['columns'].clear()
     for column_index, column in enumerate(header):
-        field_schema = schema.get('fields', defaults.FIELDS)[column_index]
-
-        column_info = {'field_schema': field_schema, 'column': column}
-
-        _utilities.find_row_validators(column_info=column_info, field_schema=field_schema)
+        column_info = dict(column_validators['fields'][column_index], column=column)
 
         column_validators['columns'][column_index] = column_info
 
@@ -123,28 +105,20 @@ def missingvalues(cell, schema, column_validators):
 
 def patternfields(header, schema, column_validators):
     """
-    patternfields is not a validator, but append field schema in patternfields to column_validators
+    patternfields is not a validator, but pass validators in column_validators['patternfields'], which are prepared
+    by Validator, to matched columns
     """
     # If exactFields is True, ignore patternFields
     if schema.get('exactFields', defaults.EXACTFIELDS):
         return
 
-    column_validators['patternfields'] = {}
-    for pattern, field_schema in schema['patternFields'].items():
-        column_info = {
-            'field_schema': field_schema,
-        }
-        _utilities.find_row_validators(column_info=column_info, field_schema=field_schema)
-
-        column_validators['patternfields'][pattern] = column_info
-
     for column_index, column in enumerate(header):
         # If it's defined in `fields` option, skip it
         if column_validators['columns'].get(column_index) is not None:
             continue
 
         for regex, column_info in column_validators['patternfields'].items():
-            if not re.match(regex, column):
+            if not column_info['regex'].match(column):
                 continue
 
             new_column_info = {'column': column, 'pattern': regex}
@@ -159,6 +133,40 @@ def patternfields(header, schema, column_validators):
     yield from ()
 
 
+def rowrules(header, schema, column_validators):
+    """
+    rowrules checks the fields referenced by row rules in column_validators['rowrules'], which are prepared by
+    Validator, are in header and have field schemas, and find the column indexes of the fields. Fields without field
+    schemas are never converted into typed values, so rules referencing them are not checked.
+
+    It must run after patternfields, since columns matching patternFields have field schemas.
+
+    Sample column_validators['rowrulecolumns'] [(<rules.RowRule>, {'<FIELD_NAME>': <COLUMN_INDEX>})]
+    """
+    column_validators['rowrulecolumns'] = []
+    for rule in column_validators['rowrules']:
+        unfound = [field for field in rule.fields if field not in header]
+        if unfound:
+            yield exceptions.ValidationError(
+                message="Row rule {0} references field(s) {1} which are not in header".format(
+                    rule.name, ', '.join(unfound)
+                )
+            )
+            continue
+
+        fields = {field: header.index(field) for field in rule.fields}
+        untyped = [field for field, index in fields.items() if index not in column_validators['columns']]
+        if untyped:
+            yield exceptions.ValidationError(
+                message="Row rule {0} references field(s) {1} which have no field schema".format(
+                    rule.name, ', '.join(untyped)
+                )
+            )
+            continue
+
+        column_validators['rowrulecolumns'].append((rule, fields))
+
+
 def field_required(header, schema, column_validators):
     if schema.get('exactFields', defaults.EXACTFIELDS):
         return
@@ -12,19 +12,22 @@ from pycsvschema.validators import types
 # :param field_schema: related option object under `fields`
 
 
-def field_type(cell, schema, field_schema):
+def field_type(cell, schema, field_schema, type_validator=None):
     # type is default validator and fields.type could be empty, so it has default value
     # type validator must run before other field validators (excluding $ref), since it transforms the value type in cell
-    type_name = field_schema.get('type', defaults.FIELDS_TYPE)
+    # type_validator is prepared once for every field by _utilities.find_row_validators, otherwise create it per cell
+    if type_validator is None:
+        type_name = field_schema.get('type', defaults.FIELDS_TYPE)
+        type_validator = types.TYPE_MAPPER[type_name](field_schema=field_schema)
 
-    mapper = types.TYPE_MAPPER[type_name](field_schema=field_schema)
-    if mapper.validate(value=cell['value']) is False:
+    result, value = type_validator.convert(cell['value'])
+    if result is False:
         yield exceptions.ValidationError(
             message="Value {0} does not satisfy the type or format".format(cell['value']),
             column=field_schema.get('name'),
             row=cell['row']
         )
-    cell['value'] = mapper.value
+    cell['value'] = value
     # TODO: do we need type?
     # cell['dtype'] = mapper.to_type
 
@@ -0,0 +1,172 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+# Row rules are expressions over the typed values of fields in a row, defined in `rowRules` option, like
+#   {"name": "dates", "expression": "end_date >= start_date"}
+#   {"expression": "status != 'closed' or closed_at is not null"}
+#
+# Expressions use a subset of Python expression syntax. Fields are referenced by their names, or by row['<NAME>'] if
+# the name is not an identifier. null, true and false are the same as None, True and False. Expressions are checked
+# against a whitelist of syntax, then field names are replaced with row['<NAME>'] in the source, which is compiled
+# once into functions when schema is prepared.
+
+import ast
+import io
+import keyword
+import sys
+import tokenize
+from pycsvschema import exceptions
+
+# Names which don't reference fields
+CONSTANTS = {'null': 'None', 'true': 'True', 'false': 'False', 'None': 'None', 'True': 'True', 'False': 'False'}
+FUNCTIONS = {'abs': abs, 'len': len, 'max': max, 'min': min}
+
+ALLOWED_NODE_NAMES = [
+    'Expression', 'BoolOp', 'And', 'Or', 'UnaryOp', 'Not', 'USub', 'UAdd', 'BinOp', 'Add', 'Sub', 'Mult', 'Div', 'Mod',
+    'FloorDiv', 'Compare', 'Eq', 'NotEq', 'Lt', 'LtE', 'Gt', 'GtE', 'In', 'NotIn', 'Is', 'IsNot', 'IfExp', 'Call',
+    'Name', 'Load', 'Subscript', 'Tuple', 'List', 'Set'
+]
+# Literals are ast.Constant since Python 3.8, and subscripts are wrapped in ast.Index before Python 3.9
+if sys.version_info >= (3, 8):
+    ALLOWED_NODE_NAMES.append('Constant')
+else:
+    ALLOWED_NODE_NAMES.extend(['Str', 'Num', 'NameConstant'])
+if sys.version_info < (3, 9):
+    ALLOWED_NODE_NAMES.append('Index')
+ALLOWED_NODES = tuple(getattr(ast, name) for name in ALLOWED_NODE_NAMES)
+
+
+def string_literal(node):
+    """
+    Value of node if it's a string literal, otherwise None
+    """
+    if sys.version_info < (3, 9) and isinstance(node, ast.Index):
+        node = node.value
+    if sys.version_info < (3, 8):
+        return node.s if isinstance(node, ast.Str) else None
+    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+
+class FieldReferences(ast.NodeVisitor):
+    """
+    Collect the referenced field names, and check subscripts and calls
+    """
+
+    def __init__(self):
+        self.fields = []
+
+    def add_field(self, name):
+        if name not in self.fields:
+            self.fields.append(name)
+
+    def visit_Name(self, node):
+        if node.id not in CONSTANTS and node.id not in FUNCTIONS and node.id != 'row':
+            self.add_field(node.id)
+
+    def visit_Subscript(self, node):
+        # Only row['<NAME>'] is allowed
+        name = string_literal(node.slice)
+        if not (isinstance(node.value, ast.Name) and node.value.id == 'row' and name is not None):
+            raise ValueError("Only row['<NAME>'] subscript is allowed in row rules")
+
+        self.add_field(name)
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+            raise ValueError("Only {0} could be called in row rules".format(', '.join(sorted(FUNCTIONS))))
+
+        for arg in node.args:
+            self.visit(arg)
+
+
+def reference_fields(expression):
+    """
+    Replace field names in expression with row['<NAME>'], and constants with Python constants
+    """
+    tokens = []
+    for token in tokenize.generate_tokens(io.StringIO(expression).readline):
+        token_type, string = token[0], token[1]
+        if token_type == tokenize.COMMENT:
+            continue
+        if token_type == tokenize.NAME and not keyword.iskeyword(string):
+            if string in CONSTANTS:
+                string = CONSTANTS[string]
+            elif string not in FUNCTIONS and string != 'row':
+                tokens.extend([(tokenize.NAME, 'row'), (tokenize.OP, '['), (tokenize.STRING, repr(string))])
+                token_type, string = tokenize.OP, ']'
+        tokens.append((token_type, string))
+    return tokenize.untokenize(tokens).strip()
+
+
+class RowRule:
+    def __init__(self, rule):
+        """
+        :param rule: Rule object in `rowRules` option, like {'name': 'dates', 'expression': 'end_date >= start_date'}
+        """
+        self.rule = rule
+        self.expression = rule['expression']
+        self.name = rule.get('name', self.expression)
+
+        expression = self.expression.strip()
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError as e:
+            raise ValueError("Invalid expression in row rule {0}: {1}".format(self.name, e.msg))
+        for node in ast.walk(tree):
+            if not isinstance(node, ALLOWED_NODES):
+                raise ValueError("{0} is not allowed in row rule {1}".format(type(node).__name__, self.name))
+
+        references = FieldReferences()
+        references.visit(tree)
+        self.fields = references.fields
+        self.fields_set = frozenset(self.fields)
+
+        # Compile into `lambda row: <expression>` and `lambda rows: [<expression> for row in rows]`
+        source = reference_fields(expression)
+        namespace = {'__builtins__': {}}
+        namespace.update(FUNCTIONS)
+        self.function = self.compile('lambda row: ({0})'.format(source), namespace)
+        self.batch_function = self.compile('lambda rows: [({0}) for row in rows]'.format(source), namespace)
+
+    def compile(self, source, namespace):
+        return eval(compile(source, '<rowRules: {0}>'.format(self.name), 'eval'), namespace)
+
+    def __reduce__(self):
+        # Compiled functions could not be pickled, so compile the rule again when it's unpickled
+        return RowRule, (self.rule, )
+
+    def evaluation_error(self, error):
+        return exceptions.ValidationError(
+            message="Row rule {0} could not be evaluated: {1}: {2}".format(self.name, type(error).__name__, error)
+        )
+
+    def check(self, row):
+        """
+        :param row: Typed values of fields in dict, like {'<NAME>': <VALUE>}
+        :return: Whether row satisfies the rule
+        :raise exceptions.ValidationError: If the rule could not be evaluated, like comparing None with a number
+        """
+        try:
+            return bool(self.function(row))
+        except Exception as e:
+            raise self.evaluation_error(e)
+
+    def check_many(self, rows):
+        """
+        Check a batch of rows at once, which avoids calling the rule for every row
+
+        :param rows: List of typed values of fields in dict
+        :return: List of whether every row satisfies the rule, or exceptions.ValidationError for the rows on which the
+        rule could not be evaluated
+        """
+        try:
+            return [bool(result) for result in self.batch_function(rows)]
+        except Exception:
+            # Find out the rows which could not be evaluated
+            results = []
+            for row in rows:
+                try:
+                    results.append(self.check(row))
+                except exceptions.ValidationError as e:
+                    results.append(e)
+            return results
@@ -17,22 +17,36 @@
 # integer
 # boolean
 #
+# Modules only required by some formats are imported when a validator of that format is created
 
-import rfc3986
+import functools
 import re
-import uuid
-import datetime
-import ipaddress
 from pycsvschema import defaults
 
 
 class TypeValidator(object):
+    """
+    Type validators don't keep state of validated values in convert(), so one instance could be shared by all cells of
+    a field, even across threads. validate() is kept for compatibility, which stores the converted value in self.value.
+    """
+
     def __init__(self, field_schema):
         self.field_schema = field_schema
         self.format = self.field_schema.get('format', defaults.FIELDS_FORMAT)
         self.value = None
         self.to_type = None
 
+    @staticmethod
+    def can_convert_value(value, to_type, convertor_config=None):
+        if not convertor_config:
+            convertor_config = {}
+
+        try:
+            to_type(value, **convertor_config)
+        except Exception:
+            return False
+        return True
+
     def try_convert_value(self, value, to_type, convertor_config=None, update=False):
         if not convertor_config:
             convertor_config = {}
@@ -48,8 +62,15 @@ class TypeValidator(object):
             self.value = value
         return True
 
+    def convert(self, value):
+        """
+        :return: (result, converted value). Result is None if value is None, otherwise whether value is valid.
+        """
+        return None, None
+
     def validate(self, value):
-        pass
+        result, self.value = self.convert(value)
+        return result
 
 
 class StringValidator(TypeValidator):
@@ -60,68 +81,169 @@ class StringValidator(TypeValidator):
     def __init__(self, field_schema):
         super().__init__(field_schema=field_schema)
         self.to_type = str
-        self.pattern = ''
+        if self.format == 'datetime':
+            self.pattern = self.field_schema.get('datetimePattern', defaults.FIELDS_FORMAT_DATETIME_PATTERN)
+        else:
+            self.pattern = self.field_schema.get('pattern', defaults.FIELDS_TYPE_STRING_PATTERN)
 
-    def validate(self, value):
-        if value is None:
-            return
+        # Module of the format is imported once for the field, format_type is the function or class checking values
+        self.format_type = None
+        if self.format == 'uri':
+            import rfc3986
 
-        self.value = value
+            self.format_type = rfc3986.is_valid_uri
+        elif self.format == 'uuid':
+            import uuid
+
+            self.format_type = uuid.UUID
+        elif self.format == 'ipv4':
+            import ipaddress
+
+            self.format_type = ipaddress.IPv4Address
+        elif self.format == 'ipv6':
+            import ipaddress
+
+            self.format_type = ipaddress.IPv6Address
+        elif self.format == 'datetime':
+            import datetime
 
+            self.format_type = datetime.datetime.strptime
+
+        # Patterns are compiled once for the field, the compiled patterns are pickled into schema artifacts
+        self.regex = None
         if self.format == 'email':
-            if not re.match(self.EMAIL_PATTERN, value):
+            self.regex = re.compile(self.EMAIL_PATTERN)
+        elif self.format == 'hostname':
+            self.regex = re.compile(self.HOSTNAME_PATTERN)
+        elif self.format_type is None and self.pattern:
+            self.regex = re.compile(self.pattern)
+
+    def convert(self, value):
+        if value is None:
+            return None, None
+
+        return self.check_format(value), value
+
+    def check_format(self, value):
+        if self.format in ('email', 'hostname'):
+            if not self.regex.match(value):
                 return False
         elif self.format == 'uri':
-            if not rfc3986.is_valid_uri(value, require_scheme=True):
+            if not self.format_type(value, require_scheme=True):
                 return False
         elif self.format == 'uuid':
-            return self.try_convert_value(value=value, to_type=uuid.UUID, convertor_config={'version': 4})
-        elif self.format == 'ipv4':
-            return self.try_convert_value(value=value, to_type=ipaddress.IPv4Address)
-        elif self.format == 'ipv6':
-            return self.try_convert_value(value=value, to_type=ipaddress.IPv6Address)
-        elif self.format == 'hostname':
-            if not re.match(self.HOSTNAME_PATTERN, value):
-                return False
+            return self.can_convert_value(value=value, to_type=self.format_type, convertor_config={'version': 4})
+        elif self.format in ('ipv4', 'ipv6'):
+            return self.can_convert_value(value=value, to_type=self.format_type)
         elif self.format == 'datetime':
-            self.pattern = self.field_schema.get('datetimePattern', defaults.FIELDS_FORMAT_DATETIME_PATTERN)
             try:
-                datetime.datetime.strptime(value, self.pattern)
+                self.format_type(value, self.pattern)
             except Exception:
                 return False
-        elif self.field_schema.get('pattern', defaults.FIELDS_TYPE_STRING_PATTERN):
-            self.pattern = self.field_schema.get('pattern', defaults.FIELDS_TYPE_STRING_PATTERN)
-            if not re.match(self.pattern, value):
+        elif self.regex is not None:
+            if not self.regex.match(value):
                 return False
         return True
 
 
-class NumberValidator(TypeValidator):
-    def __init__(self, field_schema):
-        super().__init__(field_schema=field_schema)
-        self.to_type = float
-        self.groupchar = self.field_schema.get('groupChar', defaults.FIELDS_GROUPCHAR)
+# Patterns of the values accepted by float() and int(), so that the values could be converted without exceptions
+# nan and infinity must not be next to letters, otherwise words like Banana and info are numbers when bareNumber is
+# false, which ignores the characters around the number
+NUMBER_PATTERN = r"[+-]?(?:(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?|" \
+                 r"(?<![^\W\d_])(?:[nN][aA][nN]|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?)(?![^\W\d_]))"
+INTEGER_PATTERN = r"[+-]?\d+"
 
-    def validate(self, value):
-        if value is None:
-            return
 
-        value = value.replace(self.groupchar, '')
-        return self.try_convert_value(value=value, to_type=self.to_type, update=True)
+@functools.lru_cache(maxsize=None)
+def numeric_regex(pattern, bare_number):
+    """
+    Compile the regex to prevalidate numeric values, the number is captured in group `number`
+
+    If bare_number is False, leading and trailing non-numeric characters, like currency and percent signs, are
+    ignored. A sign is allowed either before or after the leading characters, like -$5 or $-5.
+    """
+    if bare_number:
+        return re.compile(r"\s*(?P<number>{0})\s*".format(pattern))
 
+    # The sign before leading characters is captured in group `sign`, then the number must not have another sign
+    return re.compile(r"(?P<sign>[+-])?[^\d.+-]*(?P<number>(?(sign)(?![+-])){0})[^\d]*".format(pattern))
+
+
+class NumericValidator(TypeValidator):
+    """
+    Base class of number and integer type, which prevalidates value before conversion, so that invalid values don't
+    raise exceptions. Plain decimal numbers are checked by str methods, other values by regex.
+    """
+    PATTERN = ''
+    # Number of decimal points allowed in plain decimal numbers
+    DECIMAL_POINTS = 0
+    TO_TYPE = None
 
-class IntegerValidator(TypeValidator):
     def __init__(self, field_schema):
         super().__init__(field_schema=field_schema)
-        self.to_type = int
+        self.to_type = self.TO_TYPE
         self.groupchar = self.field_schema.get('groupChar', defaults.FIELDS_GROUPCHAR)
+        self.decimalchar = self.field_schema.get('decimalChar', defaults.FIELDS_DECIMALCHAR)
+        self.barenumber = self.field_schema.get('bareNumber', defaults.FIELDS_BARENUMBER)
+        if self.groupchar and self.groupchar == self.decimalchar:
+            raise ValueError("groupChar and decimalChar must be different")
+        # Whether values are numbers as they are, without groupChar, decimalChar or characters around numbers
+        self.plain = not self.groupchar and self.decimalchar == '.' and self.barenumber
+        self.decimal_points = self.DECIMAL_POINTS
 
-    def validate(self, value):
+    def normalize(self, value):
+        """
+        Remove groupChar and replace decimalChar with dot, return the number string or None if it's invalid
+        """
+        if self.groupchar:
+            value = value.replace(self.groupchar, '')
+        if self.decimalchar != '.':
+            # Dot is not a decimal point when decimalChar is another character
+            if '.' in value:
+                return None
+            value = value.replace(self.decimalchar, '.')
+
+        # Plain decimal numbers, with or without sign
+        if self.barenumber:
+            if value.replace('.', '', self.decimal_points).isdecimal():
+                return value
+            if value[:1] in ('-', '+') and value[1:].replace('.', '', self.decimal_points).isdecimal():
+                return value
+
+        match = numeric_regex(self.PATTERN, self.barenumber).fullmatch(value)
+        if match is None:
+            return None
+
+        if self.barenumber or match.group('sign') is None:
+            return match.group('number')
+        return match.group('sign') + match.group('number')
+
+    def convert(self, value):
         if value is None:
-            return
+            return None, None
+
+        # Plain decimal numbers skip normalize(), which is the common case
+        if not self.plain or not value.replace('.', '', self.decimal_points).isdecimal():
+            value = self.normalize(value)
+            if value is None:
+                return False, None
+
+        try:
+            return True, self.to_type(value)
+        except ValueError:
+            # int() refuses integers longer than sys.get_int_max_str_digits()
+            return False, None
 
-        value = value.replace(self.groupchar, '')
-        return self.try_convert_value(value=value, to_type=self.to_type, update=True)
+
+class NumberValidator(NumericValidator):
+    PATTERN = NUMBER_PATTERN
+    DECIMAL_POINTS = 1
+    TO_TYPE = float
+
+
+class IntegerValidator(NumericValidator):
+    PATTERN = INTEGER_PATTERN
+    TO_TYPE = int
 
 
 class BooleanValidator(TypeValidator):
@@ -131,14 +253,12 @@ class BooleanValidator(TypeValidator):
         self.truevalues = self.field_schema.get('trueValues', defaults.FIELDS_TRUEVALUES)
         self.falsevalues = self.field_schema.get('falseValues', defaults.FIELDS_FALSEVALUES)
 
-    def validate(self, value):
+    def convert(self, value):
         if value in self.truevalues:
-            self.value = True
+            return True, True
         elif value in self.falsevalues:
-            self.value = False
-        else:
-            return False
-        return True
+            return True, False
+        return False, None
 
 
 TYPE_MAPPER = {
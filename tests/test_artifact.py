@@ -0,0 +1,122 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import copy
+import os
+import tempfile
+import unittest
+
+from pycsvschema import artifact
+from pycsvschema.checker import Validator
+
+SCHEMA = {
+    'fields': [
+        {'name': 'id', 'type': 'number', 'minimum': 0},
+        {'name': 'status', 'type': 'string', 'enum': ['open', 'closed']},
+    ],
+    'definitions': {},
+    'patternFields': {},
+    'missingValues': ['', 'NA']
+}
+
+
+class TestArtifact(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'schema.artifact')
+        artifact.save_artifact(SCHEMA, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_does_not_modify_schema(self):
+        self.assertEqual(SCHEMA['fields'][1]['enum'], ['open', 'closed'])
+
+    def test_not_stale_for_source_schema(self):
+        self.assertFalse(artifact.is_stale(self.path, copy.deepcopy(SCHEMA)))
+
+    def test_hash_ignores_order_of_keys_and_set_values(self):
+        schema = copy.deepcopy(SCHEMA)
+        schema['fields'][1]['enum'] = ['closed', 'open']
+        schema = dict(reversed(list(schema.items())))
+        self.assertFalse(artifact.is_stale(self.path, schema))
+
+    def test_stale_for_changed_schema(self):
+        schema = copy.deepcopy(SCHEMA)
+        schema['fields'][0]['minimum'] = 1
+        self.assertTrue(artifact.is_stale(self.path, schema))
+
+        schema = copy.deepcopy(SCHEMA)
+        schema['fields'][1]['enum'].append('pending')
+        self.assertTrue(artifact.is_stale(self.path, schema))
+
+    def test_schema_updated_by_validator(self):
+        schema = copy.deepcopy(SCHEMA)
+        Validator(csvfile='', schema=schema)
+        self.assertIsInstance(schema['fields'][1]['enum'], set)
+
+        self.assertFalse(artifact.is_stale(self.path, schema))
+        validator = Validator.from_artifact('', self.path, source_schema=schema)
+        self.assertEqual(validator.schema['fields'][1]['enum'], {'open', 'closed'})
+
+    def test_load_stale_artifact(self):
+        schema = copy.deepcopy(SCHEMA)
+        schema['fields'][0]['type'] = 'string'
+        with self.assertRaises(ValueError):
+            artifact.load_artifact(self.path, source_schema=schema)
+        with self.assertRaises(ValueError):
+            Validator.from_artifact('', self.path, source_schema=schema)
+
+    def test_validate_from_artifact(self):
+        schema = {
+            'fields': [
+                {'name': 'id', 'type': 'number', 'minimum': 0},
+                {'name': 'email', 'type': 'string', 'format': 'email'},
+                {'name': 'code', 'type': 'string', 'pattern': '[A-Z]{2}[0-9]+'},
+                {'name': 'status', 'type': 'string', 'enum': ['open', 'closed']},
+            ],
+            'definitions': {},
+            'patternFields': {},
+            'rowRules': [{'name': 'positive', 'expression': "status != 'closed' or id > 10"}]
+        }
+        path = os.path.join(self.tmp.name, 'data.csv')
+        with open(path, 'w') as f:
+            f.write('id,email,code,status\n')
+            for i in range(100):
+                f.write(
+                    '{0},{1},{2},{3}\n'.format(
+                        i - 5, 'user{0}@example.com'.format(i) if i % 9 else 'user', 'AB{0}'.format(i) if i % 4 else 'x',
+                        ('open', 'closed', 'other')[i % 3]
+                    )
+                )
+
+        artifact_path = os.path.join(self.tmp.name, 'rows.artifact')
+        artifact.save_artifact(schema, artifact_path)
+
+        outputs = []
+        for validator in (
+            Validator(path, copy.deepcopy(schema), output=os.path.join(self.tmp.name, 'schema.txt'), errors='coerce'),
+            Validator.from_artifact(
+                path, artifact_path, output=os.path.join(self.tmp.name, 'artifact.txt'), errors='coerce',
+                source_schema=schema
+            ),
+        ):
+            validator.validate()
+            with open(validator.output) as f:
+                outputs.append(f.read())
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertIn("<ValidationError: 'Value x does not satisfy the type or format'; column: code; row: 1>", outputs[1])
+        self.assertIn("<ValidationError: 'Value user does not satisfy the type or format'; column: email; row: 10>",
+                      outputs[1])
+        self.assertIn("<ValidationError: 'Row does not satisfy rule positive'; column: None; row: 2>", outputs[1])
+
+    def test_not_an_artifact(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not an artifact\n')
+        with self.assertRaises(ValueError):
+            artifact.load_artifact(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import unittest
+
+from pycsvschema import _utilities
+from tests.utils import CSVTestCase
+
+
+def lookup(cache, key):
+    result = cache.get(key)
+    if result is None:
+        cache.put(key, (key, []))
+    return result
+
+
+class TestColumnCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = _utilities.ColumnCache(maxsize=2)
+        cache.put('a', ('a', []))
+        cache.put('b', ('b', []))
+        self.assertEqual(cache.get('a'), ('a', []))
+
+        # b is the least recently used
+        cache.put('c', ('c', []))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), ('a', []))
+        self.assertEqual(cache.get('c'), ('c', []))
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_stats(self):
+        cache = _utilities.ColumnCache(maxsize=10)
+        for key in ('a', 'a', 'b', 'a'):
+            lookup(cache, key)
+        self.assertEqual(
+            cache.stats(), {'hits': 2, 'misses': 2, 'hit_rate': 0.5, 'size': 2, 'enabled': True}
+        )
+
+    def test_filling_is_not_checked(self):
+        # Distinct values fit in the cache, so the misses of filling it don't disable it
+        cache = _utilities.ColumnCache(maxsize=10000, window=1000)
+        for i in range(30000):
+            lookup(cache, i % 6000)
+        self.assertTrue(cache.enabled)
+        self.assertEqual(cache.stats()['hits'], 24000)
+
+    def test_disabled_after_low_windows_in_a_row(self):
+        cache = _utilities.ColumnCache(maxsize=100, window=100, patience=3)
+        for i in range(100):
+            lookup(cache, i)
+        self.assertTrue(cache.enabled)
+
+        # Two low windows followed by a good one don't disable the cache
+        for i in range(200):
+            lookup(cache, 'x{0}'.format(i))
+        for i in range(100):
+            lookup(cache, 'x199')
+        self.assertTrue(cache.enabled)
+
+        for i in range(300):
+            lookup(cache, 'y{0}'.format(i))
+        self.assertFalse(cache.enabled)
+        self.assertEqual(cache.stats()['size'], 0)
+
+        cache.put('z', ('z', []))
+        self.assertIsNone(cache.get('z'))
+
+    def test_min_hit_rate(self):
+        for min_hit_rate, enabled in ((0.4, True), (0.6, False)):
+            cache = _utilities.ColumnCache(maxsize=10, window=10, min_hit_rate=min_hit_rate, patience=1)
+            for i in range(100):
+                # Every other lookup is a hit, so hit rate is 0.5
+                lookup(cache, 'hot' if i % 2 else i)
+            self.assertEqual(cache.enabled, enabled, min_hit_rate)
+
+
+class TestValidatorCache(CSVTestCase):
+    SCHEMA = {
+        'fields': [{'name': 'country', 'enum': ['US', 'DE']}, {'name': 'id', 'type': 'number'}],
+        'definitions': {},
+        'patternFields': {}
+    }
+
+    def csv_content(self):
+        return 'country,id\n' + ''.join('{0},{1}\n'.format(('US', 'DE', 'x')[i % 3], i) for i in range(3000))
+
+    def test_same_errors_as_without_cache(self):
+        expected = self.validate()
+        self.assertEqual(self.validate(cache_size=100, cache_window=100, cache_min_hit_rate=0.5), expected)
+
+        stats = {column_stats['column']: column_stats for column_stats in self.validator.cache_stats().values()}
+        self.assertTrue(stats['country']['enabled'])
+        self.assertEqual(stats['country']['misses'], 3)
+        self.assertFalse(stats['id']['enabled'])
+
+
+if __name__ == '__main__':
+    unittest.main()
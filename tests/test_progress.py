@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import io
+import logging
+import os
+import unittest
+
+from pycsvschema import exceptions, progress
+from tests.utils import CSVTestCase
+
+
+class TestProgress(CSVTestCase):
+    SCHEMA = {'fields': [{'name': 'id', 'type': 'number'}], 'definitions': {}, 'patternFields': {}}
+
+    def csv_content(self):
+        return 'id\n' + ''.join('{0}\n'.format('x' if i in (10, 1500) else i) for i in range(2000))
+
+    def validate(self, reporter, progress_every=100, **kwargs):
+        return super().validate(
+            progress=reporter, progress_interval=0, progress_every=progress_every, check_schema=False, **kwargs
+        )
+
+    def test_finished(self):
+        for kwargs in ({}, {'workers': 2, 'batch_size': 300}, {'projection': True}):
+            reports = []
+            self.validate(reports.append, **kwargs)
+
+            self.assertGreater(len(reports), 1, kwargs)
+            self.assertTrue(all(report['status'] == 'running' for report in reports[:-1]), kwargs)
+            self.assertEqual(
+                [report['rows'] for report in reports], sorted(report['rows'] for report in reports), kwargs
+            )
+
+            last = reports[-1]
+            self.assertEqual(last['status'], 'finished')
+            self.assertTrue(last['finished'])
+            self.assertEqual(last['rows'], 2000)
+            self.assertEqual(last['errors'], 2)
+            self.assertEqual(last['bytes_read'], os.path.getsize(self.path))
+            self.assertEqual(last['percent'], 100.0)
+            self.assertEqual(last['eta'], 0.0)
+
+    def test_aborted(self):
+        reports = []
+        with self.assertRaises(exceptions.ValidationError):
+            self.validate(reports.append, errors='raise', progress_every=1)
+
+        last = reports[-1]
+        self.assertEqual(last['status'], 'aborted')
+        self.assertFalse(last['finished'])
+        self.assertIsNone(last['eta'])
+        # Validation stops at the error in row 11, before the row is counted as checked
+        self.assertEqual(last['rows'], 10)
+        self.assertEqual(last['errors'], 1)
+
+    def test_progress_bar(self):
+        stream = io.StringIO()
+        self.validate(progress.ProgressBar(stream=stream, width=10))
+        self.assertTrue(stream.getvalue().endswith('\n'))
+        self.assertIn('[##########] 100.0% 2000 rows', stream.getvalue())
+
+        stream = io.StringIO()
+        with self.assertRaises(exceptions.ValidationError):
+            self.validate(progress.ProgressBar(stream=stream), errors='raise')
+        self.assertTrue(stream.getvalue().endswith('(aborted)\n'))
+
+    def test_progress_logger(self):
+        logger = logging.getLogger('tests.progress')
+        with self.assertLogs(logger, level=logging.INFO) as cm:
+            self.validate(progress.ProgressLogger(logger=logger))
+
+        self.assertTrue(cm.output[-1].startswith('INFO:tests.progress:Validation finished: 2000 rows'))
+        self.assertEqual(cm.records[-1].progress['errors'], 2)
+
+    def test_format_seconds(self):
+        self.assertEqual(progress.format_seconds(None), '--:--:--')
+        self.assertEqual(progress.format_seconds(3725.5), '1:02:05')
+
+
+class TestThreadedProgress(CSVTestCase):
+    SCHEMA = {'fields': [{'name': 'id', 'type': 'number'}], 'definitions': {}, 'patternFields': {}}
+    ROWS = 20000
+
+    def csv_content(self):
+        return 'id\n' + ''.join('{0}\n'.format(i) for i in range(self.ROWS))
+
+    def test_bytes_read_of_checked_rows(self):
+        # Bytes at the end of every row
+        ends = [len('id\n')]
+        for i in range(self.ROWS):
+            ends.append(ends[-1] + len('{0}\n'.format(i)))
+
+        for kwargs in ({}, {'projection': True}):
+            reports = []
+            self.validate(
+                progress=reports.append, progress_interval=0, progress_every=1, workers=2, batch_size=1000, **kwargs
+            )
+
+            running = [report for report in reports if report['status'] == 'running']
+            self.assertGreater(len(running), 1, kwargs)
+            for report in running:
+                # Text decoding reads the file in chunks of 8192 bytes, but not the batches read ahead of checking
+                self.assertLessEqual(report['bytes_read'], ends[report['rows']] + 8192, kwargs)
+            self.assertEqual(reports[-1]['bytes_read'], os.path.getsize(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
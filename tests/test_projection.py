@@ -0,0 +1,89 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import csv
+import io
+import unittest
+
+from pycsvschema import _utilities
+from tests.utils import CSVTestCase
+
+CSV_CONTENT = (
+    'a,b,c,d\r\n'
+    '1,2,3,4\r\n'
+    '"x,y",2,"multi\r\nline ""quoted""",4\r\n'
+    '5,6\r\n'
+    '\r\n'
+    '7,8,9,10,11\r\n'
+    "'q',,,\r\n"
+)
+
+
+def read_projected(content, indexes, **csv_pars):
+    return list(_utilities.projected_reader(io.StringIO(content, newline=''), indexes, count_fields=True, **csv_pars))
+
+
+def read_expected(content, indexes, **csv_pars):
+    rows = []
+    for row in csv.reader(io.StringIO(content, newline=''), **csv_pars):
+        if len(row) <= max(indexes):
+            rows.append((None, len(row)))
+        else:
+            rows.append(([row[i] for i in indexes], len(row)))
+    return rows
+
+
+class TestProjectedReader(unittest.TestCase):
+    def test_same_as_csv_reader(self):
+        for indexes in ([0], [2, 0], [1, 2], [3]):
+            self.assertEqual(read_projected(CSV_CONTENT, indexes), read_expected(CSV_CONTENT, indexes), indexes)
+
+    def test_multiline_quoted_field(self):
+        rows = read_projected(CSV_CONTENT, [0, 2])
+        self.assertEqual(rows[2], (['x,y', 'multi\r\nline "quoted"'], 4))
+        # The line after the quoted field is read as a new row
+        self.assertEqual(rows[3], (None, 2))
+
+    def test_short_rows(self):
+        rows = read_projected(CSV_CONTENT, [3])
+        self.assertEqual(rows[3], (None, 2))
+        self.assertEqual(rows[4], (None, 0))
+        self.assertEqual(rows[5], (['10'], 5))
+
+    def test_field_count_not_counted(self):
+        rows = list(_utilities.projected_reader(io.StringIO('1,2,3\r\n4,5\r\n', newline=''), [1]))
+        self.assertEqual(rows, [(['2'], None), (['5'], None)])
+
+    def test_csv_parameters(self):
+        content = "a;'b;c';d\r\n1;2;3\r\n"
+        csv_pars = {'delimiter': ';', 'quotechar': "'"}
+        self.assertEqual(read_projected(content, [1, 2], **csv_pars), read_expected(content, [1, 2], **csv_pars))
+
+        csv_pars = {'skipinitialspace': True}
+        content = 'a, "b,c", d\r\n'
+        self.assertEqual(read_projected(content, [1, 2], **csv_pars), read_expected(content, [1, 2], **csv_pars))
+
+
+class TestValidatorProjection(CSVTestCase):
+    CSV_CONTENT = CSV_CONTENT
+    SCHEMA = {
+        'fields': [{'name': 'a', 'type': 'number'}, {'name': 'd', 'type': 'number', 'maximum': 5}],
+        'definitions': {},
+        'patternFields': {}
+    }
+
+    def test_same_errors_as_csv_reader(self):
+        for check_field_count in (False, True):
+            self.assertEqual(
+                self.validate(projection=True, check_field_count=check_field_count),
+                self.validate(projection=False, check_field_count=check_field_count)
+            )
+
+    def test_field_count(self):
+        errors = self.validate(projection=True, check_field_count=True)
+        self.assertIn("<ValidationError: 'Row has 2 fields while header has 4 fields'; column: None; row: 3>", errors)
+        self.assertIn("<ValidationError: 'Row has 5 fields while header has 4 fields'; column: None; row: 5>", errors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import copy
+import pickle
+import unittest
+
+from pycsvschema import exceptions
+from pycsvschema.validators.rules import RowRule
+from tests.utils import CSVTestCase
+
+
+class TestRowRule(unittest.TestCase):
+    def test_rejects_disallowed_syntax(self):
+        expressions = (
+            "a.__class__",
+            "__import__('os')",
+            "(lambda: 1)()",
+            "[x for x in a]",
+            "a[0]",
+            "other['a']",
+            "row[a]",
+            "max(a, key=b)",
+            "a.lower()",
+            "(a := 1)",
+            "f'{a}'",
+        )
+        for expression in expressions:
+            with self.assertRaises(ValueError, msg=expression):
+                RowRule({'expression': expression})
+
+    def test_syntax_error(self):
+        with self.assertRaises(ValueError):
+            RowRule({'name': 'broken', 'expression': 'a >'})
+
+    def test_fields(self):
+        rule = RowRule({'expression': "end >= start and row['closed at'] is not null and abs(total) > 0"})
+        self.assertEqual(rule.fields, ['end', 'start', 'closed at', 'total'])
+        self.assertEqual(rule.name, rule.expression)
+
+    def test_check(self):
+        rule = RowRule({'name': 'dates', 'expression': "status != 'closed' or closed_at is not null"})
+        self.assertEqual(rule.name, 'dates')
+        self.assertTrue(rule.check({'status': 'open', 'closed_at': None}))
+        self.assertTrue(rule.check({'status': 'closed', 'closed_at': '2020-01-01'}))
+        self.assertFalse(rule.check({'status': 'closed', 'closed_at': None}))
+
+    def test_field_names_in_strings_and_comments(self):
+        rule = RowRule({'expression': "status != 'end' or end is null  # end is optional"})
+        self.assertEqual(rule.fields, ['status', 'end'])
+        self.assertTrue(rule.check({'status': 'end', 'end': None}))
+        self.assertFalse(rule.check({'status': 'end', 'end': 1}))
+
+    def test_evaluation_error(self):
+        rule = RowRule({'name': 'dates', 'expression': 'end >= start'})
+        with self.assertRaises(exceptions.ValidationError) as cm:
+            rule.check({'start': None, 'end': 1})
+        self.assertEqual(
+            cm.exception.message,
+            "Row rule dates could not be evaluated: TypeError: '>=' not supported between instances of 'int' and "
+            "'NoneType'"
+        )
+        with self.assertRaises(exceptions.ValidationError):
+            rule.check({'end': 1})
+
+    def test_check_many(self):
+        rule = RowRule({'expression': 'end >= start'})
+        rows = [{'start': 1, 'end': 2}, {'start': 3, 'end': 2}, {'start': 2, 'end': 2}]
+        self.assertEqual(rule.check_many(rows), [True, False, True])
+        self.assertEqual(rule.check_many(rows), [rule.check(row) for row in rows])
+
+        results = rule.check_many(rows + [{'start': None, 'end': 2}])
+        self.assertEqual(results[:3], [True, False, True])
+        self.assertIsInstance(results[3], exceptions.ValidationError)
+
+    def test_pickle(self):
+        rule = pickle.loads(pickle.dumps(RowRule({'name': 'dates', 'expression': 'end >= start'})))
+        self.assertEqual(rule.name, 'dates')
+        self.assertEqual(rule.fields, ['end', 'start'])
+        self.assertFalse(rule.check({'start': 3, 'end': 2}))
+
+
+class TestValidatorRowRules(CSVTestCase):
+    SCHEMA = {
+        'fields': [{'name': 'start', 'type': 'number'}, {'name': 'end', 'type': 'number'}],
+        'definitions': {},
+        'patternFields': {'^no': {'type': 'number'}},
+        'rowRules': [
+            {'name': 'dates', 'expression': 'end >= start'},
+            {'name': 'note', 'expression': "note != 2 or start >= 0"},
+        ]
+    }
+
+    def csv_content(self):
+        return 'start,end,note\n' + ''.join(
+            '{0},{1},{2}\n'.format(i, ('x' if i % 11 == 0 else i + (-1 if i % 7 == 0 else 1)), i % 3)
+            for i in range(1000)
+        )
+
+    def test_rule_errors(self):
+        errors = self.validate()
+        self.assertIn("<ValidationError: 'Row does not satisfy rule dates'; column: None; row: 8>", errors)
+        self.assertEqual(sum('rule' in error for error in errors), len([i for i in range(1000) if i % 7 == 0]) - 13)
+
+    def test_rule_not_checked_on_failed_conversion(self):
+        errors = self.validate()
+        self.assertEqual(
+            [error for error in errors if 'row: 12>' in error],
+            ["<ValidationError: 'Value x does not satisfy the type or format'; column: end; row: 12>"]
+        )
+
+    def test_field_without_field_schema(self):
+        self.SCHEMA = copy.deepcopy(self.SCHEMA)
+        self.SCHEMA['patternFields'] = {}
+        errors = self.validate()
+        self.assertEqual(
+            errors[0],
+            "<ValidationError: 'Row rule note references field(s) note which have no field schema'; column: None; "
+            "row: None>"
+        )
+        self.assertFalse(any('rule note' in error for error in errors[1:]))
+
+    def test_evaluation_error(self):
+        self.SCHEMA = copy.deepcopy(self.SCHEMA)
+        self.SCHEMA['missingValues'] = ['', '5']
+        for kwargs in ({}, {'workers': 2, 'batch_size': 64}):
+            errors = self.validate(**kwargs)
+            self.assertIn(
+                "<ValidationError: \"Row rule dates could not be evaluated: TypeError: '>=' not supported between "
+                "instances of 'float' and 'NoneType'\"; column: None; row: 6>", errors
+            )
+            self.assertNotIn("<ValidationError: 'Row does not satisfy rule dates'; column: None; row: 6>", errors)
+
+    def test_batches_same_as_row_by_row(self):
+        expected = self.validate()
+        self.assertEqual(self.validate(workers=2, batch_size=64), expected)
+        self.assertEqual(self.validate(workers=2, batch_size=64, cache_size=10, projection=True), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+import unittest
+
+from dev.benchmarks import DEFERRED_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartup(unittest.TestCase):
+    def test_checker_defers_heavy_modules(self):
+        code = (
+            "import sys\n"
+            "import pycsvschema.checker\n"
+            "print(','.join(m for m in {0!r} if m in sys.modules))\n".format(DEFERRED_MODULES)
+        )
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, universal_newlines=True)
+        self.assertEqual(out.strip(), '')
+
+    def test_validator_without_schema_check_defers_jsonschema(self):
+        code = (
+            "import sys\n"
+            "from pycsvschema.checker import Validator\n"
+            "Validator(csvfile='', schema={'fields': [], 'definitions': {}, 'patternFields': {}}, "
+            "check_schema=False)\n"
+            "print('jsonschema' in sys.modules)\n"
+        )
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, universal_newlines=True)
+        self.assertEqual(out.strip(), 'False')
+
+    def test_format_modules_imported_with_validator(self):
+        code = (
+            "import sys\n"
+            "from pycsvschema.validators.types import StringValidator\n"
+            "StringValidator({'type': 'string', 'format': 'ipv4'})\n"
+            "print('ipaddress' in sys.modules, 'uuid' in sys.modules)\n"
+        )
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, universal_newlines=True)
+        self.assertEqual(out.strip(), 'True False')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import math
+import pickle
+import unittest
+
+from pycsvschema.validators.types import IntegerValidator, NumberValidator, StringValidator
+
+
+class TestNumberNormalize(unittest.TestCase):
+    def test_bare_number(self):
+        validator = NumberValidator({'type': 'number'})
+        self.assertEqual(validator.normalize('1.5'), '1.5')
+        self.assertEqual(validator.normalize('-1.5'), '-1.5')
+        self.assertEqual(validator.normalize(' 1e3 '), '1e3')
+        self.assertEqual(validator.normalize('.5'), '.5')
+        self.assertEqual(validator.normalize('NaN'), 'NaN')
+        self.assertEqual(validator.normalize('-Infinity'), '-Infinity')
+        self.assertIsNone(validator.normalize('$5'))
+        self.assertIsNone(validator.normalize('5%'))
+        self.assertIsNone(validator.normalize('1.2.3'))
+        self.assertIsNone(validator.normalize('--1'))
+        self.assertIsNone(validator.normalize(''))
+
+    def test_not_bare_number(self):
+        validator = NumberValidator({'type': 'number', 'bareNumber': False})
+        self.assertEqual(validator.normalize('$5'), '5')
+        self.assertEqual(validator.normalize('5%'), '5')
+        self.assertEqual(validator.normalize('EUR 1.5'), '1.5')
+        self.assertEqual(validator.normalize('-$5'), '-5')
+        self.assertEqual(validator.normalize('$-5'), '-5')
+        self.assertEqual(validator.normalize('$inf'), 'inf')
+        self.assertIsNone(validator.normalize('-$-5'))
+        self.assertIsNone(validator.normalize('$'))
+        self.assertIsNone(validator.normalize('5 and 6'))
+
+    def test_not_bare_number_rejects_words(self):
+        validator = NumberValidator({'type': 'number', 'bareNumber': False})
+        for value in ('Banana', 'info', 'Infinityx', 'nano', 'xnan', 'Ünan'):
+            self.assertEqual(validator.convert(value), (False, None), value)
+
+    def test_decimal_char_and_group_char(self):
+        validator = NumberValidator({'type': 'number', 'decimalChar': ',', 'groupChar': '.'})
+        self.assertEqual(validator.normalize('1.234,5'), '1234.5')
+        self.assertEqual(validator.convert('1.234.567,25'), (True, 1234567.25))
+        self.assertEqual(validator.convert('1,2,3'), (False, None))
+
+        validator = NumberValidator({'type': 'number', 'decimalChar': ',', 'bareNumber': False})
+        self.assertEqual(validator.convert('3,5 %'), (True, 3.5))
+
+    def test_dot_is_not_decimal_point_with_other_decimal_char(self):
+        validator = NumberValidator({'type': 'number', 'decimalChar': ','})
+        self.assertEqual(validator.convert('1,5'), (True, 1.5))
+        self.assertEqual(validator.convert('1.234'), (False, None))
+        self.assertEqual(validator.convert('1.234,5'), (False, None))
+
+        validator = IntegerValidator({'type': 'integer', 'decimalChar': ',', 'groupChar': ' '})
+        self.assertEqual(validator.convert('1 234'), (True, 1234))
+        self.assertEqual(validator.convert('1.234'), (False, None))
+
+    def test_same_group_char_and_decimal_char(self):
+        with self.assertRaises(ValueError):
+            NumberValidator({'type': 'number', 'decimalChar': ',', 'groupChar': ','})
+        with self.assertRaises(ValueError):
+            NumberValidator({'type': 'number', 'groupChar': '.'})
+
+    def test_convert(self):
+        validator = NumberValidator({'type': 'number'})
+        self.assertEqual(validator.convert('2.25'), (True, 2.25))
+        self.assertEqual(validator.convert('abc'), (False, None))
+        self.assertEqual(validator.convert(None), (None, None))
+        result, value = validator.convert('nan')
+        self.assertTrue(result)
+        self.assertTrue(math.isnan(value))
+
+
+class TestInteger(unittest.TestCase):
+    def test_convert(self):
+        validator = IntegerValidator({'type': 'integer'})
+        self.assertEqual(validator.convert('42'), (True, 42))
+        self.assertEqual(validator.convert('-42'), (True, -42))
+        self.assertEqual(validator.convert('4.2'), (False, None))
+        self.assertEqual(validator.convert('1e3'), (False, None))
+        self.assertEqual(validator.convert('nan'), (False, None))
+
+    def test_too_many_digits(self):
+        validator = IntegerValidator({'type': 'integer'})
+        self.assertEqual(validator.convert('9' * 5000), (False, None))
+
+    def test_not_bare_number(self):
+        validator = IntegerValidator({'type': 'integer', 'bareNumber': False, 'groupChar': ','})
+        self.assertEqual(validator.convert('$1,000'), (True, 1000))
+        self.assertEqual(validator.convert('$1,000.5'), (False, None))
+
+
+class TestStringFormats(unittest.TestCase):
+    CASES = {
+        'email': ('user@example.com', 'user@'),
+        'uri': ('https://example.com/a?b=c', 'example'),
+        'uuid': ('c4a760a8-dbcf-4e14-9f39-645a8e933d74', 'c4a760a8'),
+        'ipv4': ('10.0.0.1', '10.0.0.256'),
+        'ipv6': ('::1', '10.0.0.1'),
+        'hostname': ('www.example.com', '-example.com'),
+        'datetime': ('2020-01-01T10:00:00.000000+0000', '2020-01-01'),
+    }
+
+    def test_formats(self):
+        for format, (valid, invalid) in self.CASES.items():
+            validator = StringValidator({'type': 'string', 'format': format})
+            self.assertEqual(validator.convert(valid), (True, valid), format)
+            self.assertEqual(validator.convert(invalid), (False, invalid), format)
+
+    def test_pickle(self):
+        for format, (valid, invalid) in self.CASES.items():
+            validator = pickle.loads(pickle.dumps(StringValidator({'type': 'string', 'format': format})))
+            self.assertEqual(validator.convert(valid), (True, valid), format)
+            self.assertEqual(validator.convert(invalid), (False, invalid), format)
+
+    def test_pattern(self):
+        validator = StringValidator({'type': 'string', 'pattern': '[a-z]+[0-9]'})
+        self.assertEqual(validator.convert('abc1'), (True, 'abc1'))
+        self.assertEqual(validator.convert('1abc'), (False, '1abc'))
+
+
+if __name__ == '__main__':
+    unittest.main()
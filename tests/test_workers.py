@@ -0,0 +1,55 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import threading
+import unittest
+
+from pycsvschema import exceptions
+from tests.utils import CSVTestCase
+
+
+class TestWorkers(CSVTestCase):
+    SCHEMA = {
+        'fields': [{'name': 'id', 'type': 'number'}, {'name': 'amount', 'type': 'number', 'maximum': 90}],
+        'definitions': {},
+        'patternFields': {}
+    }
+
+    def csv_content(self):
+        return 'id,amount\n' + ''.join('{0},{1}\n'.format(i if i % 7 else 'x', i % 100) for i in range(5000))
+
+    def test_same_errors_as_single_thread(self):
+        expected = self.validate()
+        self.assertEqual(self.validate(workers=4, batch_size=300), expected)
+        self.assertEqual(self.validate(workers=3, batch_size=1000, projection=True), expected)
+
+    def test_raise_stops_thread_pool(self):
+        threads = threading.active_count()
+        # assertRaises clears the frames of traceback, which would close the generators of validation
+        try:
+            self.validate(errors='raise', workers=4, batch_size=100)
+        except exceptions.ValidationError as e:
+            self.assertEqual(e.row, 1)
+            self.assertEqual(threading.active_count(), threads)
+        else:
+            self.fail('ValidationError not raised')
+
+    def test_state_of_last_validation(self):
+        for errors, kwargs in (('coerce', {}), ('coerce', {'workers': 2, 'batch_size': 300}), ('raise', {})):
+            try:
+                self.validate(errors=errors, **kwargs)
+            except exceptions.ValidationError:
+                pass
+
+            self.assertEqual(self.validator.header, ['id', 'amount'])
+            self.assertEqual(self.validator.header, self.validator.last_run.header)
+            self.assertEqual(sorted(self.validator.column_validators['columns']), [0, 1])
+
+        # Validations running at the same time don't share state
+        run = self.validator.new_run()
+        self.assertEqual(run.header, [])
+        self.assertEqual(run.column_validators, {'columns': {}, 'unfoundfields': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+#!/usr/bin/python
+# -*-coding: utf-8 -*-
+
+import copy
+import os
+import tempfile
+import unittest
+
+from pycsvschema.checker import Validator
+
+
+class CSVTestCase(unittest.TestCase):
+    """
+    Test case validating a CSV file in a temporary directory. Subclasses provide the CSV file in CSV_CONTENT or
+    csv_content(), and the schema in SCHEMA.
+    """
+    CSV_CONTENT = ''
+    SCHEMA = {'fields': [], 'definitions': {}, 'patternFields': {}}
+
+    def csv_content(self):
+        return self.CSV_CONTENT
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'data.csv')
+        with open(self.path, 'w', newline='') as f:
+            f.write(self.csv_content())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def validate(self, errors='coerce', **kwargs):
+        """
+        Validate the CSV file against a copy of SCHEMA and return the lines of errors. The validator is kept in
+        self.validator.
+        """
+        output = os.path.join(self.tmp.name, 'errors.txt')
+        self.validator = Validator(self.path, copy.deepcopy(self.SCHEMA), output=output, errors=errors, **kwargs)
+        self.validator.validate()
+        with open(output) as f:
+            return f.read().splitlines()